@@ -40,8 +40,14 @@ from ai_use_case_context.escalation import EscalationPolicy, EscalationResult
 from ai_use_case_context.serialization import (
     to_dict,
     from_dict,
+    from_dict_many,
     to_json,
+    to_json_bytes,
     from_json,
+    dump,
+    iter_chunks,
+    to_msgpack,
+    from_msgpack,
 )
 from ai_use_case_context.security import (
     # TPN dimensions
@@ -82,11 +88,13 @@ from ai_use_case_context.governance_hooks import (
     GovernanceEventType,
     GovernanceEvent,
     GovernanceHook,
+    DispatchMode,
     register_hook,
     unregister_hook,
     clear_hooks,
     registered_hooks,
     emit_governance_event,
+    flush_async_hooks,
     AuditLogger,
     ComplianceGate,
     NotificationBridge,
@@ -154,8 +162,14 @@ __all__ = [
     # Serialization
     "to_dict",
     "from_dict",
+    "from_dict_many",
     "to_json",
+    "to_json_bytes",
     "from_json",
+    "dump",
+    "iter_chunks",
+    "to_msgpack",
+    "from_msgpack",
     # Security presets — TPN
     "TPN_CONTENT_SECURITY",
     "TPN_PHYSICAL_SECURITY",
@@ -193,11 +207,13 @@ __all__ = [
     "GovernanceEventType",
     "GovernanceEvent",
     "GovernanceHook",
+    "DispatchMode",
     "register_hook",
     "unregister_hook",
     "clear_hooks",
     "registered_hooks",
     "emit_governance_event",
+    "flush_async_hooks",
     "AuditLogger",
     "ComplianceGate",
     "NotificationBridge",
@@ -7,10 +7,12 @@ that implement the flag / route / block governance model.
 
 from __future__ import annotations
 
-from enum import Enum
-from dataclasses import dataclass, field
+import sys
+from enum import Enum, IntEnum
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Optional, Union
+from typing import Iterable, Optional, Union
+from weakref import WeakSet
 
 
 # ---------------------------------------------------------------------------
@@ -26,15 +28,14 @@ class RiskDimension(Enum):
     FEASIBILITY = "Technical Feasibility"
     QUALITY = "Output Quality"
 
-    def __eq__(self, other: object) -> bool:
-        if isinstance(other, RiskDimension):
-            return self is other
-        if isinstance(other, Dimension):
-            return self.name == other.name
-        return NotImplemented
+    # Equality and hashing are Enum's own: identity between members, and
+    # hash(name).  Comparing against a custom Dimension falls through to
+    # Dimension.__eq__, which matches by name, and the shared hash keeps a
+    # built-in and a same-named Dimension interchangeable as dict keys.
 
-    def __hash__(self) -> int:
-        return hash(self.name)
+
+# Built-in dimensions in definition order, materialized once.
+_BUILTIN_DIMS: tuple[RiskDimension, ...] = tuple(RiskDimension)
 
 
 # ---------------------------------------------------------------------------
@@ -98,7 +99,7 @@ def custom_dimension(name: str, label: str) -> Dimension:
 DimensionType = Union[RiskDimension, Dimension]
 
 
-class RiskLevel(Enum):
+class RiskLevel(IntEnum):
     """
     How severe the risk is. Determines routing and blocking behavior.
       NONE      - No concerns identified.
@@ -114,6 +115,14 @@ class RiskLevel(Enum):
     CRITICAL = 4
 
 
+# Plain-int thresholds for the blocking / review predicates.
+_HIGH = RiskLevel.HIGH.value
+_MEDIUM = RiskLevel.MEDIUM.value
+
+# Display icon per RiskLevel, indexed by level value.
+_LEVEL_ICONS = ("✅", "🔵", "🟡", "🟠", "🔴")
+
+
 class ReviewStatus(Enum):
     """Tracks where a flagged risk is in the review process."""
     OPEN = "Open"
@@ -123,12 +132,45 @@ class ReviewStatus(Enum):
     BLOCKED = "Blocked"
 
 
+# Statuses that close out a flag; anything else counts as unresolved.
+_RESOLVED_STATES = frozenset({ReviewStatus.RESOLVED, ReviewStatus.ACCEPTED})
+
+
 # ---------------------------------------------------------------------------
 # Data classes
 # ---------------------------------------------------------------------------
 
-@dataclass
-class RiskFlag:
+# Flag attributes whose changes the owning UseCaseContext must hear about:
+# they feed its flag index or its cached reviewer list.
+_TRACKED_FIELDS = frozenset({"dimension", "level", "status", "reviewer"})
+
+# dataclass(slots=True) needs Python 3.10+; older versions fall back to __dict__.
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+class _FlagState:
+    """Derived per-flag state that lives outside the dataclass fields.
+
+    Kept in a slotted base so it stays out of ``__init__``, ``__eq__`` and
+    ``__repr__`` and works whether or not ``RiskFlag`` itself has slots.
+
+      _owners      - context whose index is invalidated when the flag changes,
+                     or a WeakSet of contexts once the flag is shared;
+                     _CONSTRUCTING until __post_init__ has run.
+      is_blocking  - HIGH or CRITICAL and not yet resolved/accepted.
+      needs_review - MEDIUM or above and still open.
+    """
+
+    __slots__ = ("_owners", "is_blocking", "needs_review")
+
+
+# Marks a RiskFlag whose generated __init__ is still assigning fields, so
+# __setattr__ can skip change tracking until the flag is fully built.
+_CONSTRUCTING = object()
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class RiskFlag(_FlagState):
     """A single risk flag attached to a use case."""
     dimension: DimensionType
     level: RiskLevel
@@ -139,33 +181,85 @@ class RiskFlag:
     created_at: datetime = field(default_factory=datetime.now)
     resolved_at: Optional[datetime] = None
 
-    @property
-    def is_blocking(self) -> bool:
-        """A flag blocks the workflow if it's HIGH or CRITICAL and not yet resolved."""
-        return (
-            self.level.value >= RiskLevel.HIGH.value
-            and self.status not in (ReviewStatus.RESOLVED, ReviewStatus.ACCEPTED)
+    def __new__(cls, *args, **kwargs):
+        self = object.__new__(cls)
+        object.__setattr__(self, "_owners", _CONSTRUCTING)
+        return self
+
+    def __post_init__(self):
+        # Reviewer roles repeat across many flags; interning collapses them
+        # to one object each and makes set/dict lookups identity compares.
+        if self.reviewer:
+            object.__setattr__(self, "reviewer", sys.intern(self.reviewer))
+        self._refresh_predicates()
+        object.__setattr__(self, "_owners", None)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        object.__setattr__(self, name, value)
+        if name in _TRACKED_FIELDS:
+            owners = self._owners
+            if owners is _CONSTRUCTING:
+                return
+            if name == "status" or name == "level":
+                self._refresh_predicates()
+            if type(owners) is WeakSet:
+                for ctx in owners:
+                    ctx._flags_changed()
+            elif owners is not None:
+                owners._flags_changed()
+
+    # Pickle/copy by field values so the derived state is recomputed on
+    # restore and copies are not attached to the original's context.
+    def __getstate__(self) -> list:
+        return [getattr(self, f.name) for f in fields(self)]
+
+    def __setstate__(self, state: list) -> None:
+        for f, value in zip(fields(self), state):
+            object.__setattr__(self, f.name, value)
+        self.__post_init__()
+
+    def _adopt(self, ctx: UseCaseContext) -> None:
+        """Have *ctx* notified whenever a tracked attribute changes."""
+        owners = self._owners
+        if owners is None:
+            self._owners = ctx
+        elif type(owners) is WeakSet:
+            owners.add(ctx)
+        elif owners is not ctx:
+            # Now shared between contexts; hold them all weakly.
+            self._owners = WeakSet((owners, ctx))
+
+    def _refresh_predicates(self) -> None:
+        level = self.level
+        status = self.status
+        object.__setattr__(
+            self,
+            "is_blocking",
+            level >= _HIGH
+            and status not in _RESOLVED_STATES,
         )
-
-    @property
-    def needs_review(self) -> bool:
-        """A flag needs review if it's MEDIUM or above and still open."""
-        return (
-            self.level.value >= RiskLevel.MEDIUM.value
-            and self.status == ReviewStatus.OPEN
+        object.__setattr__(
+            self,
+            "needs_review",
+            level >= _MEDIUM and status is ReviewStatus.OPEN,
         )
 
-    def resolve(self, notes: str = ""):
-        """Mark this flag as resolved."""
+
+    def resolve(self, notes: str = "", at: Optional[datetime] = None):
+        """Mark this flag as resolved.
+
+        Pass ``at`` to record a known resolution time (e.g. when replaying
+        an audit trail) instead of the current time.
+        """
         self.status = ReviewStatus.RESOLVED
         self.resolution_notes = notes
-        self.resolved_at = datetime.now()
+        self.resolved_at = at or datetime.now()
 
-    def accept_risk(self, notes: str = ""):
+    def accept_risk(self, notes: str = "", at: Optional[datetime] = None):
         """Acknowledge the risk and allow the workflow to proceed."""
         self.status = ReviewStatus.ACCEPTED
         self.resolution_notes = notes
-        self.resolved_at = datetime.now()
+        self.resolved_at = at or datetime.now()
 
     def begin_review(self):
         """Move this flag into the In Review state."""
@@ -176,19 +270,89 @@ class RiskFlag:
         self.status = ReviewStatus.BLOCKED
 
     def __str__(self):
-        icon = {
-            RiskLevel.NONE: "✅",
-            RiskLevel.LOW: "🔵",
-            RiskLevel.MEDIUM: "🟡",
-            RiskLevel.HIGH: "🟠",
-            RiskLevel.CRITICAL: "🔴",
-        }.get(self.level, "⚪")
+        level = self.level
+        icon = _LEVEL_ICONS[level] if 0 <= level < len(_LEVEL_ICONS) else "⚪"
         return (
             f"{icon} [{self.dimension.value}] {self.level.name}: "
             f"{self.description} ({self.status.value})"
         )
 
 
+@dataclass
+class _FlagScan:
+    """Aggregates collected in a single pass over a context's risk flags."""
+    blocking: int
+    pending: int
+    reviewers: dict[str, None]  # ordered set, in flag order
+    max_level: RiskLevel
+
+
+class _FlagIndex:
+    """Lookups derived from a context's risk flags.
+
+    Built in one pass and extended in place as flags are added through
+    ``flag_risk``.  Any change to a flag's dimension, level or status drops
+    the whole index so it is rebuilt on the next query; rebuilding (rather
+    than moving flags between buckets) keeps every bucket in flag order.
+    """
+
+    __slots__ = (
+        "source", "size", "dims", "dim_levels", "open_levels",
+        "by_dim", "by_status", "by_level", "blocking", "pending",
+    )
+
+    def __init__(self, flags: list[RiskFlag]):
+        self.source = flags
+        self.size = 0
+        # dimension name -> first dimension object seen with that name
+        self.dims: dict[str, DimensionType] = {}
+        # dimension name -> count of unresolved flags per RiskLevel value
+        self.dim_levels: dict[str, list[int]] = {}
+        # count of unresolved flags per RiskLevel value, across dimensions
+        self.open_levels = [0] * len(RiskLevel)
+        # flags bucketed by dimension name, status and level
+        self.by_dim: dict[str, list[RiskFlag]] = {}
+        self.by_status: dict[ReviewStatus, list[RiskFlag]] = {}
+        self.by_level: dict[RiskLevel, list[RiskFlag]] = {}
+        # flags that currently block / need review
+        self.blocking: list[RiskFlag] = []
+        self.pending: list[RiskFlag] = []
+        for flag in flags:
+            self.add(flag)
+
+    def add(self, flag: RiskFlag) -> None:
+        self.size += 1
+        dimension = flag.dimension
+        level = flag.level
+        status = flag.status
+        name = dimension.name
+        counts = self.dim_levels.get(name)
+        if counts is None:
+            self.dims[name] = dimension
+            counts = self.dim_levels[name] = [0] * len(RiskLevel)
+            self.by_dim[name] = [flag]
+        else:
+            self.by_dim[name].append(flag)
+        if status not in _RESOLVED_STATES:
+            counts[level] += 1
+            self.open_levels[level] += 1
+        self.by_status.setdefault(status, []).append(flag)
+        self.by_level.setdefault(level, []).append(flag)
+        if flag.is_blocking:
+            self.blocking.append(flag)
+        if flag.needs_review:
+            self.pending.append(flag)
+
+
+def _highest(counts: Optional[list[int]]) -> int:
+    """Return the highest level value with a non-zero count, or 0."""
+    if counts:
+        for value in range(len(counts) - 1, 0, -1):
+            if counts[value]:
+                return value
+    return 0
+
+
 # ---------------------------------------------------------------------------
 # Routing rules
 # ---------------------------------------------------------------------------
@@ -228,6 +392,10 @@ DEFAULT_ROUTING: dict[tuple[RiskDimension, RiskLevel], str] = {
 }
 
 
+# Shared placeholder for contexts created without tags.
+_EMPTY_TAGS: tuple[str, ...] = ()
+
+
 # ---------------------------------------------------------------------------
 # Main class
 # ---------------------------------------------------------------------------
@@ -245,7 +413,10 @@ class UseCaseContext:
         workflow_phase:    Which phase of the production pipeline this falls in.
         tags:             Freeform tags for taxonomy/categorization.
         risk_flags:       List of RiskFlag objects.
-        routing_table:    Mapping of (dimension, level) -> reviewer role.
+        routing_table:    Mapping of (dimension, level) -> reviewer role.  After
+                          a security profile is applied this is a ``ChainMap``
+                          over the shared table; see :meth:`flatten_routing`.
+        created_at:       When the use case was created (defaults to now).
     """
 
     def __init__(
@@ -255,14 +426,97 @@ class UseCaseContext:
         workflow_phase: str = "",
         tags: Optional[list[str]] = None,
         routing_table: Optional[dict[tuple[DimensionType, RiskLevel], str]] = None,
+        created_at: Optional[datetime] = None,
     ):
         self.name = name
         self.description = description
-        self.workflow_phase = workflow_phase
-        self.tags = tags or []
+        self.workflow_phase = workflow_phase and sys.intern(workflow_phase)
+        self._tags: Union[list[str], tuple[str, ...]] = tags or _EMPTY_TAGS
         self.risk_flags: list[RiskFlag] = []
         self.routing_table = routing_table or DEFAULT_ROUTING
-        self.created_at = datetime.now()
+        self.created_at = created_at or datetime.now()
+        self._index: Optional[_FlagIndex] = None
+        # Bumped whenever flags are added or an indexed flag attribute changes;
+        # see _stamp().
+        self._version = 0
+        self._reviewers_memo: Optional[tuple[tuple[int, int, int], list[str]]] = None
+
+    # -- Tags --------------------------------------------------------------
+
+    @property
+    def tags(self) -> list[str]:
+        """Freeform tags; a list is only allocated once tags are accessed."""
+        if self._tags is _EMPTY_TAGS:
+            self._tags = []
+        return self._tags
+
+    @tags.setter
+    def tags(self, tags: Optional[list[str]]):
+        self._tags = tags or _EMPTY_TAGS
+
+    def add_tag(self, tag: str) -> None:
+        """Append a tag if it is not already present."""
+        if tag not in self._tags:
+            self.tags.append(tag)
+
+    # -- Routing -----------------------------------------------------------
+
+    def flatten_routing(self) -> dict[tuple[DimensionType, RiskLevel], str]:
+        """Return the effective routing table as a new plain dict."""
+        return dict(self.routing_table)
+
+    def _route(self, dimension: DimensionType, level: RiskLevel) -> str:
+        """Look up the reviewer for a dimension/level pair.
+
+        Reads the routing table live, so in-place edits (including to the
+        shared ``DEFAULT_ROUTING``) apply to the next flag.  Custom
+        dimensions hash and compare by name, like ``RiskDimension``.
+        """
+        return self.routing_table.get((dimension, level), "Unassigned")
+
+    # -- Index -------------------------------------------------------------
+
+    def _flag_index(self) -> _FlagIndex:
+        """Return the flag index, rebuilding it if flags changed since last use.
+
+        Appends made directly to ``risk_flags`` (or replacing the list) are
+        picked up automatically; flags found during a rebuild are adopted so
+        their later mutations invalidate this context's index.
+        """
+        index = self._index
+        flags = self.risk_flags
+        if index is None or index.source is not flags or index.size != len(flags):
+            for flag in flags:
+                flag._adopt(self)
+            index = self._index = _FlagIndex(flags)
+        return index
+
+    def _flags_changed(self) -> None:
+        """Called by an owned flag when a tracked attribute changes."""
+        self._index = None
+        self._version += 1
+
+    def _stamp(self) -> tuple[int, int, int]:
+        """Cheap token that changes whenever this context's flags change.
+
+        Lets aggregators such as GovernanceDashboard cache derived results.
+        Direct appends to (or replacement of) ``risk_flags`` are covered by
+        the list's identity and length.  Going through the index first adopts
+        any flags that arrived that way, so their later mutations bump
+        ``_version`` too.
+        """
+        self._flag_index()
+        flags = self.risk_flags
+        return (self._version, id(flags), len(flags))
+
+    def invalidate(self) -> None:
+        """Discard cached flag lookups.
+
+        Only needed after editing ``risk_flags`` in place in ways that keep
+        its length unchanged (e.g. replacing an element).
+        """
+        self._index = None
+        self._version += 1
 
     # -- Flagging ----------------------------------------------------------
 
@@ -272,59 +526,105 @@ class UseCaseContext:
         level: RiskLevel,
         description: str,
         reviewer: str = "",
+        created_at: Optional[datetime] = None,
     ) -> RiskFlag:
         """
         Flag a risk on this use case.
 
         If no reviewer is provided, one is auto-assigned from the routing table.
+        ``created_at`` defaults to now; pass a timestamp when importing or
+        replaying historical flags.
         Returns the created RiskFlag so you can further manipulate it.
         """
         if not reviewer:
-            reviewer = self.routing_table.get(
-                (dimension, level), "Unassigned"
-            )
+            reviewer = self._route(dimension, level)
 
         flag = RiskFlag(
             dimension=dimension,
             level=level,
             description=description,
             reviewer=reviewer,
+            created_at=created_at or datetime.now(),
         )
-        self.risk_flags.append(flag)
+        index = self._index
+        flags = self.risk_flags
+        if index is not None and index.source is flags and index.size == len(flags):
+            index.add(flag)
+        flag._adopt(self)
+        flags.append(flag)
+        self._version += 1
         return flag
 
+    def flag_risks(self, specs: Iterable[tuple]) -> list[RiskFlag]:
+        """
+        Flag several risks at once, e.g. when replaying an audit trail.
+
+        Each spec is ``(dimension, level, description)`` optionally followed
+        by ``reviewer`` and ``created_at``, in ``flag_risk``'s argument order.
+        Flags without a ``created_at`` share one timestamp for the batch.
+        Nothing is added if any spec is invalid.  Returns the created flags.
+        """
+        flags = self.risk_flags
+        index = self._index
+        if index is not None and (index.source is not flags or index.size != len(flags)):
+            index = None
+        now: Optional[datetime] = None
+        created: list[RiskFlag] = []
+        for dimension, level, description, *rest in specs:
+            reviewer = rest[0] if rest else ""
+            created_at = rest[1] if len(rest) > 1 else None
+            if created_at is None:
+                created_at = now = now or datetime.now()
+            flag = RiskFlag(
+                dimension=dimension,
+                level=level,
+                description=description,
+                reviewer=reviewer or self._route(dimension, level),
+                created_at=created_at,
+            )
+            flag._adopt(self)
+            created.append(flag)
+        if index is not None:
+            for flag in created:
+                index.add(flag)
+        flags.extend(created)
+        self._version += 1
+        return created
+
     # -- Routing -----------------------------------------------------------
 
     def get_pending_reviews(self) -> list[RiskFlag]:
         """Return all flags that still need review."""
-        return [f for f in self.risk_flags if f.needs_review]
+        return list(self._flag_index().pending)
 
     def get_reviewers_needed(self) -> list[str]:
-        """Return a deduplicated list of reviewers who need to act."""
-        return list({
-            f.reviewer
-            for f in self.risk_flags
-            if f.needs_review or f.is_blocking
-        })
+        """Return a deduplicated list of reviewers who need to act.
+
+        Reviewers are listed in the order their flags were raised.
+        """
+        stamp = self._stamp()
+        memo = self._reviewers_memo
+        if memo is None or memo[0] != stamp:
+            memo = self._reviewers_memo = (stamp, list(self._scan().reviewers))
+        return list(memo[1])
 
     # -- Blocking ----------------------------------------------------------
 
     def is_blocked(self) -> bool:
         """True if any unresolved HIGH or CRITICAL flag exists."""
-        return any(f.is_blocking for f in self.risk_flags)
+        open_levels = self._flag_index().open_levels
+        return any(open_levels[_HIGH:])
 
     def get_blockers(self) -> list[RiskFlag]:
         """Return the specific flags that are blocking the workflow."""
-        return [f for f in self.risk_flags if f.is_blocking]
+        return list(self._flag_index().blocking)
 
     # -- Scoring -----------------------------------------------------------
 
     def dimensions(self) -> list[DimensionType]:
         """Return all dimensions present in flags, plus all built-in ones."""
-        seen: dict[str, DimensionType] = {}
-        for flag in self.risk_flags:
-            seen.setdefault(flag.dimension.name, flag.dimension)
-        for dim in RiskDimension:
+        seen = dict(self._flag_index().dims)
+        for dim in _BUILTIN_DIMS:
             seen.setdefault(dim.name, dim)
         return list(seen.values())
 
@@ -334,67 +634,75 @@ class UseCaseContext:
         Includes all built-in dimensions plus any custom ones with flags.
         Useful for dashboards and summary views.
         """
-        scores: dict[str, int] = {}
-        for dim in self.dimensions():
-            dim_flags = [
-                f for f in self.risk_flags
-                if f.dimension == dim
-                and f.status not in (ReviewStatus.RESOLVED, ReviewStatus.ACCEPTED)
-            ]
-            scores[dim.value] = max(
-                (f.level.value for f in dim_flags), default=0
-            )
-        return scores
+        dim_levels = self._flag_index().dim_levels
+        return {
+            dim.value: _highest(dim_levels.get(dim.name))
+            for dim in self.dimensions()
+        }
 
     # -- Querying ----------------------------------------------------------
 
     def get_flags_by_dimension(self, dimension: DimensionType) -> list[RiskFlag]:
         """Return all flags for a specific dimension."""
-        return [f for f in self.risk_flags if f.dimension == dimension]
+        return list(self._flag_index().by_dim.get(dimension.name, ()))
 
     def get_flags_by_status(self, status: ReviewStatus) -> list[RiskFlag]:
         """Return all flags with a specific review status."""
-        return [f for f in self.risk_flags if f.status == status]
+        return list(self._flag_index().by_status.get(status, ()))
 
     def get_flags_by_level(self, level: RiskLevel) -> list[RiskFlag]:
         """Return all flags at a specific risk level."""
-        return [f for f in self.risk_flags if f.level == level]
+        return list(self._flag_index().by_level.get(level, ()))
 
     def max_risk_level(self) -> RiskLevel:
         """Return the highest unresolved risk level across all dimensions."""
-        unresolved = [
-            f for f in self.risk_flags
-            if f.status not in (ReviewStatus.RESOLVED, ReviewStatus.ACCEPTED)
-        ]
-        if not unresolved:
-            return RiskLevel.NONE
-        return max(unresolved, key=lambda f: f.level.value).level
+        return RiskLevel(_highest(self._flag_index().open_levels))
 
     # -- Summary -----------------------------------------------------------
 
+    def _scan(self) -> _FlagScan:
+        """Collect blockers, pending reviews, reviewers and max level in one pass."""
+        n_blocking = n_pending = 0
+        reviewers: dict[str, None] = {}
+        max_level = RiskLevel.NONE
+        for flag in self.risk_flags:
+            if flag.status in _RESOLVED_STATES:
+                continue
+            level = flag.level
+            if level > max_level:
+                max_level = level
+            blocking = flag.is_blocking
+            review = flag.needs_review
+            n_blocking += blocking
+            n_pending += review
+            if blocking or review:
+                reviewers[flag.reviewer] = None
+        return _FlagScan(n_blocking, n_pending, reviewers, max_level)
+
     def summary(self) -> str:
         """Human-readable summary of this use case's governance status."""
+        scan = self._scan()
         lines = [
             f"Use Case: {self.name}",
             f"Phase:    {self.workflow_phase or '(not set)'}",
-            f"Status:   {'🚫 BLOCKED' if self.is_blocked() else '✅ CLEAR'}",
+            f"Status:   {'🚫 BLOCKED' if scan.blocking else '✅ CLEAR'}",
             f"Flags:    {len(self.risk_flags)} total, "
-            f"{len(self.get_blockers())} blocking, "
-            f"{len(self.get_pending_reviews())} pending review",
+            f"{scan.blocking} blocking, "
+            f"{scan.pending} pending review",
             "",
         ]
 
         if self.risk_flags:
             lines.append("Risk Flags:")
+            append = lines.append
             for flag in self.risk_flags:
-                lines.append(f"  {flag}")
+                append(f"  {flag}")
                 if flag.reviewer:
-                    lines.append(f"    → Routed to: {flag.reviewer}")
+                    append(f"    → Routed to: {flag.reviewer}")
 
-        reviewers = self.get_reviewers_needed()
-        if reviewers:
+        if scan.reviewers:
             lines.append("")
-            lines.append("Action needed from: " + ", ".join(reviewers))
+            lines.append("Action needed from: " + ", ".join(scan.reviewers))
 
         return "\n".join(lines)
 
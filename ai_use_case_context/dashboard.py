@@ -10,7 +10,8 @@ multi-project portfolio.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Optional
+from operator import itemgetter
+from typing import Iterable, Optional
 
 from ai_use_case_context.core import (
     RiskDimension,
@@ -19,6 +20,9 @@ from ai_use_case_context.core import (
     RiskFlag,
     UseCaseContext,
     DimensionType,
+    _BUILTIN_DIMS,
+    _LEVEL_ICONS,
+    _RESOLVED_STATES,
 )
 
 
@@ -31,6 +35,20 @@ class DimensionSummary:
     blocking_flags: int = 0
     max_level: RiskLevel = RiskLevel.NONE
     affected_use_cases: list[str] = field(default_factory=list)
+    # Same names as affected_use_cases, for O(1) membership tests.
+    affected: set[str] = field(default_factory=set, repr=False, compare=False)
+
+
+@dataclass
+class _PortfolioScan:
+    """Aggregates collected in a single pass over every flag in a dashboard."""
+    total_flags: int = 0
+    blocking_flags: int = 0
+    pending_flags: int = 0
+    # dimension name -> summary, for dimensions that have at least one flag
+    dimensions: dict[str, DimensionSummary] = field(default_factory=dict)
+    # reviewer -> (use case name, flag) pairs needing action
+    workload: dict[str, list[tuple[str, RiskFlag]]] = field(default_factory=dict)
 
 
 class GovernanceDashboard:
@@ -43,6 +61,17 @@ class GovernanceDashboard:
 
     def __init__(self):
         self._use_cases: dict[str, UseCaseContext] = {}
+        # (registry stamp, result) for all_dimensions() / reviewer_workload()
+        self._dimensions_memo: Optional[tuple[tuple, list[DimensionType]]] = None
+        self._workload_memo: Optional[
+            tuple[tuple, dict[str, list[tuple[str, RiskFlag]]]]
+        ] = None
+
+    def _stamp(self) -> tuple:
+        """Token that changes when use cases or any of their flags change."""
+        return tuple(
+            (name, uc, uc._stamp()) for name, uc in self._use_cases.items()
+        )
 
     # -- Registration ------------------------------------------------------
 
@@ -50,10 +79,24 @@ class GovernanceDashboard:
         """Add a use case to the dashboard."""
         self._use_cases[use_case.name] = use_case
 
+    def register_many(self, use_cases: Iterable[UseCaseContext]) -> None:
+        """Add several use cases at once, in order."""
+        self._use_cases.update((uc.name, uc) for uc in use_cases)
+
     def unregister(self, name: str) -> Optional[UseCaseContext]:
         """Remove a use case by name. Returns the removed context or None."""
         return self._use_cases.pop(name, None)
 
+    def clear(self) -> None:
+        """Remove every registered use case."""
+        self._use_cases.clear()
+        self._dimensions_memo = None
+        self._workload_memo = None
+
+    def get(self, name: str) -> Optional[UseCaseContext]:
+        """Return the registered use case called *name*, or None."""
+        return self._use_cases.get(name)
+
     @property
     def use_cases(self) -> list[UseCaseContext]:
         """All registered use cases."""
@@ -91,14 +134,18 @@ class GovernanceDashboard:
 
     def all_dimensions(self) -> list[DimensionType]:
         """Return all dimensions across all use cases (built-in + custom)."""
-        seen: dict[str, DimensionType] = {}
-        for uc in self._use_cases.values():
-            for dim in uc.dimensions():
+        stamp = self._stamp()
+        memo = self._dimensions_memo
+        if memo is None or memo[0] != stamp:
+            seen: dict[str, DimensionType] = {}
+            for uc in self._use_cases.values():
+                for dim in uc.dimensions():
+                    seen.setdefault(dim.name, dim)
+            # Ensure built-ins are always present even with no use cases
+            for dim in _BUILTIN_DIMS:
                 seen.setdefault(dim.name, dim)
-        # Ensure built-ins are always present even with no use cases
-        for dim in RiskDimension:
-            seen.setdefault(dim.name, dim)
-        return list(seen.values())
+            memo = self._dimensions_memo = (stamp, list(seen.values()))
+        return list(memo[1])
 
     def dimension_summary(self, dimension: DimensionType) -> DimensionSummary:
         """Aggregate stats for a single dimension across all use cases."""
@@ -108,19 +155,66 @@ class GovernanceDashboard:
             if not dim_flags:
                 continue
             summary.affected_use_cases.append(uc.name)
+            summary.affected.add(uc.name)
+            summary.total_flags += len(dim_flags)
             for flag in dim_flags:
-                summary.total_flags += 1
-                if flag.status not in (ReviewStatus.RESOLVED, ReviewStatus.ACCEPTED):
+                # Blocking flags are always unresolved, so they are only
+                # counted inside the open branch.
+                if flag.status not in _RESOLVED_STATES:
                     summary.open_flags += 1
-                if flag.is_blocking:
-                    summary.blocking_flags += 1
-                if flag.level.value > summary.max_level.value:
-                    summary.max_level = flag.level
+                    summary.blocking_flags += flag.is_blocking
+                level = flag.level
+                if level > summary.max_level:
+                    summary.max_level = level
         return summary
 
     def all_dimension_summaries(self) -> dict[DimensionType, DimensionSummary]:
         """Return DimensionSummary for every dimension (built-in + custom)."""
-        return {dim: self.dimension_summary(dim) for dim in self.all_dimensions()}
+        return self._dimension_summaries(self._scan())
+
+    def _dimension_summaries(
+        self, scan: _PortfolioScan
+    ) -> dict[DimensionType, DimensionSummary]:
+        summaries: dict[DimensionType, DimensionSummary] = {}
+        for dim in self.all_dimensions():
+            ds = scan.dimensions.get(dim.name)
+            if ds is None:
+                ds = DimensionSummary(dimension=dim)
+            else:
+                ds.dimension = dim
+            summaries[dim] = ds
+        return summaries
+
+    def _scan(self) -> _PortfolioScan:
+        """Walk every flag once, collecting portfolio and per-dimension counts."""
+        scan = _PortfolioScan()
+        dims = scan.dimensions
+        workload = scan.workload
+        for uc in self._use_cases.values():
+            for flag in uc.risk_flags:
+                blocking = flag.is_blocking
+                review = flag.needs_review
+                scan.total_flags += 1
+                scan.blocking_flags += blocking
+                scan.pending_flags += review
+                if blocking or review:
+                    workload.setdefault(flag.reviewer, []).append((uc.name, flag))
+
+                dimension = flag.dimension
+                ds = dims.get(dimension.name)
+                if ds is None:
+                    ds = dims[dimension.name] = DimensionSummary(dimension=dimension)
+                if uc.name not in ds.affected:
+                    ds.affected.add(uc.name)
+                    ds.affected_use_cases.append(uc.name)
+                ds.total_flags += 1
+                if flag.status not in _RESOLVED_STATES:
+                    ds.open_flags += 1
+                    ds.blocking_flags += blocking
+                level = flag.level
+                if level > ds.max_level:
+                    ds.max_level = level
+        return scan
 
     # -- Reviewer workload -------------------------------------------------
 
@@ -129,12 +223,16 @@ class GovernanceDashboard:
         Map each reviewer to their assigned (use_case_name, flag) pairs
         that still need action (needs_review or is_blocking).
         """
-        workload: dict[str, list[tuple[str, RiskFlag]]] = {}
-        for uc in self._use_cases.values():
-            for flag in uc.risk_flags:
-                if flag.needs_review or flag.is_blocking:
-                    workload.setdefault(flag.reviewer, []).append((uc.name, flag))
-        return workload
+        stamp = self._stamp()
+        memo = self._workload_memo
+        if memo is None or memo[0] != stamp:
+            workload: dict[str, list[tuple[str, RiskFlag]]] = {}
+            for uc in self._use_cases.values():
+                for flag in uc.risk_flags:
+                    if flag.needs_review or flag.is_blocking:
+                        workload.setdefault(flag.reviewer, []).append((uc.name, flag))
+            memo = self._workload_memo = (stamp, workload)
+        return {reviewer: list(items) for reviewer, items in memo[1].items()}
 
     # -- Workflow phase view -----------------------------------------------
 
@@ -152,14 +250,12 @@ class GovernanceDashboard:
         """Human-readable portfolio summary."""
         total = len(self._use_cases)
         blocked = self.blocked_use_cases()
-        all_flags = self.all_flags()
-        blocking_count = sum(1 for _, f in all_flags if f.is_blocking)
-        pending_count = sum(1 for _, f in all_flags if f.needs_review)
+        scan = self._scan()
 
         lines = [
             f"Governance Dashboard — {total} use case(s)",
             f"  Blocked: {len(blocked)}  |  Clear: {total - len(blocked)}",
-            f"  Total flags: {len(all_flags)}  |  Blocking: {blocking_count}  |  Pending review: {pending_count}",
+            f"  Total flags: {scan.total_flags}  |  Blocking: {scan.blocking_flags}  |  Pending review: {scan.pending_flags}",
             "",
         ]
 
@@ -172,27 +268,21 @@ class GovernanceDashboard:
 
         # Per-dimension overview
         lines.append("Dimension overview:")
-        for dim in self.all_dimensions():
-            ds = self.dimension_summary(dim)
-            level_icon = {
-                RiskLevel.NONE: "✅",
-                RiskLevel.LOW: "🔵",
-                RiskLevel.MEDIUM: "🟡",
-                RiskLevel.HIGH: "🟠",
-                RiskLevel.CRITICAL: "🔴",
-            }.get(ds.max_level, "⚪")
+        for dim, ds in self._dimension_summaries(scan).items():
             lines.append(
-                f"  {level_icon} {dim.value}: "
+                f"  {_LEVEL_ICONS[ds.max_level]} {dim.value}: "
                 f"{ds.open_flags} open / {ds.total_flags} total"
             )
 
         # Reviewer workload
-        workload = self.reviewer_workload()
+        workload = scan.workload
         if workload:
             lines.append("")
             lines.append("Reviewer workload:")
-            for reviewer, items in sorted(workload.items(), key=lambda x: -len(x[1])):
-                lines.append(f"  {reviewer}: {len(items)} item(s)")
+            counts = [(reviewer, len(items)) for reviewer, items in workload.items()]
+            counts.sort(key=itemgetter(1), reverse=True)
+            for reviewer, count in counts:
+                lines.append(f"  {reviewer}: {count} item(s)")
 
         return "\n".join(lines)
 
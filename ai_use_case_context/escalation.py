@@ -10,15 +10,19 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from ai_use_case_context.core import (
     RiskLevel,
     ReviewStatus,
     RiskFlag,
     UseCaseContext,
+    _RESOLVED_STATES,
 )
 
+if TYPE_CHECKING:
+    from ai_use_case_context.dashboard import GovernanceDashboard
+
 
 @dataclass
 class EscalationResult:
@@ -87,12 +91,42 @@ class EscalationPolicy:
         self.rules = rules if rules is not None else list(self.DEFAULT_RULES)
         self.routing_table = routing_table or {}
 
+    @property
+    def rules(self) -> list[EscalationRule]:
+        """The escalation rules, checked in order (first match per level wins).
+
+        Appends and removals are picked up automatically.  After replacing a
+        rule in place or changing a rule's ``from_level``, assign the list
+        again or call :meth:`invalidate`.
+        """
+        return self._rules
+
+    @rules.setter
+    def rules(self, rules: list[EscalationRule]):
+        self._rules = rules
+        self._index_rules()
+
+    def invalidate(self) -> None:
+        """Rebuild the level->rule map.
+
+        Only needed after editing ``rules`` in place in ways that keep its
+        length unchanged (e.g. replacing an element).
+        """
+        self._index_rules()
+
+    def _index_rules(self) -> None:
+        by_level: dict[RiskLevel, EscalationRule] = {}
+        for rule in self._rules:
+            by_level.setdefault(rule.from_level, rule)
+        self._rules_by_level = by_level
+        self._rules_size = len(self._rules)
+
     def _get_rule(self, level: RiskLevel) -> Optional[EscalationRule]:
         """Find the escalation rule for a given risk level."""
-        for rule in self.rules:
-            if rule.from_level == level:
-                return rule
-        return None
+        if len(self._rules) != self._rules_size:
+            # Rules were appended or removed in place.
+            self._index_rules()
+        return self._rules_by_level.get(level)
 
     def check_flag(
         self,
@@ -104,18 +138,30 @@ class EscalationPolicy:
         Check a single flag against escalation rules.
         Returns an EscalationResult if the flag should be escalated, else None.
         """
-        if flag.status in (ReviewStatus.RESOLVED, ReviewStatus.ACCEPTED):
+        if flag.status in _RESOLVED_STATES:
             return None
 
         now = now or datetime.now()
-        age = now - flag.created_at
         rule = self._get_rule(flag.level)
         if rule is None:
             return None
 
-        if age < rule.threshold:
+        # Equivalent to ``now - flag.created_at < rule.threshold``.
+        if flag.created_at > now - rule.threshold:
             return None
 
+        return self._escalate(flag, rule, use_case_name, now)
+
+    def _escalate(
+        self,
+        flag: RiskFlag,
+        rule: EscalationRule,
+        use_case_name: str,
+        now: datetime,
+    ) -> EscalationResult:
+        """Build the EscalationResult for a flag known to be past its threshold."""
+        age = now - flag.created_at
+
         # Determine who to escalate to
         escalate_reviewer = rule.escalate_to_reviewer
         if not escalate_reviewer and self.routing_table:
@@ -145,12 +191,40 @@ class EscalationPolicy:
         use_case: UseCaseContext,
         now: Optional[datetime] = None,
     ) -> list[EscalationResult]:
-        """Check all flags on a use case for escalation."""
+        """Check all flags on a use case for escalation.
+
+        Each level's creation-time cutoff is computed once per call, so the
+        per-flag test is a single datetime comparison.
+        """
+        now = now or datetime.now()
+        cutoffs: dict[RiskLevel, tuple[Optional[EscalationRule], Optional[datetime]]] = {}
         results: list[EscalationResult] = []
         for flag in use_case.risk_flags:
-            result = self.check_flag(flag, use_case.name, now)
-            if result is not None:
-                results.append(result)
+            if flag.status in _RESOLVED_STATES:
+                continue
+            level = flag.level
+            entry = cutoffs.get(level)
+            if entry is None:
+                rule = self._get_rule(level)
+                entry = cutoffs[level] = (
+                    rule, now - rule.threshold if rule is not None else None
+                )
+            rule, cutoff = entry
+            if rule is None or flag.created_at > cutoff:
+                continue
+            results.append(self._escalate(flag, rule, use_case.name, now))
+        return results
+
+    def check_dashboard(
+        self,
+        dashboard: GovernanceDashboard,
+        now: Optional[datetime] = None,
+    ) -> list[EscalationResult]:
+        """Check every use case on a dashboard against a single `now`."""
+        now = now or datetime.now()
+        results: list[EscalationResult] = []
+        for use_case in dashboard.use_cases:
+            results.extend(self.check_use_case(use_case, now))
         return results
 
     def apply_escalations(
@@ -162,7 +236,7 @@ class EscalationPolicy:
         Check and apply escalations: update flag levels and reviewers in-place.
         Returns the list of escalations that were applied.
         """
-        results = self.check_use_case(use_case, now)
+        results = self.check_use_case(use_case, now or datetime.now())
         for result in results:
             result.flag.level = result.escalate_to_level
             if result.escalate_to_reviewer:
@@ -34,10 +34,26 @@ Usage::
 
 from __future__ import annotations
 
+import json
+import os
+import queue
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from concurrent.futures import wait as futures_wait
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
-from typing import Any, Callable, Optional
+from typing import IO, Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+from ai_use_case_context.core import _DATACLASS_SLOTS, RiskFlag
 
 
 # ---------------------------------------------------------------------------
@@ -59,8 +75,23 @@ class GovernanceEventType(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
-class GovernanceEvent:
+class _EventCache:
+    """Serialized forms of an event, shared by every hook that handles it.
+
+    Kept in a slotted base so they stay out of the dataclass fields (and so
+    out of ``__init__``, ``__eq__``, ``fields()`` and ``asdict()``).  Both
+    are cleared whenever a field is reassigned.
+
+      _dict_cache - ``to_dict()`` output without ``metadata``.
+      _json_cache - (JSON of ``_dict_cache``, JSON of ``metadata``, full
+                    ``to_json_bytes()`` output) from the last encode.
+    """
+
+    __slots__ = ("_dict_cache", "_json_cache")
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class GovernanceEvent(_EventCache):
     """A structured governance event passed to hooks.
 
     All hook callbacks receive a single ``GovernanceEvent`` instance,
@@ -85,18 +116,117 @@ class GovernanceEvent:
     timestamp: datetime = field(default_factory=datetime.now)
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    def __new__(cls, *args, **kwargs):
+        self = object.__new__(cls)
+        object.__setattr__(self, "_dict_cache", None)
+        object.__setattr__(self, "_json_cache", None)
+        return self
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name[0] != "_":
+            object.__setattr__(self, "_dict_cache", None)
+            object.__setattr__(self, "_json_cache", None)
+
+    @classmethod
+    def from_flag(
+        cls,
+        event_type: GovernanceEventType,
+        use_case_name: str,
+        flag: RiskFlag,
+        *,
+        actor: str = "system",
+        metadata: Optional[dict[str, Any]] = None,
+    ) -> GovernanceEvent:
+        """Build an event describing *flag*.
+
+        The flag's dimension, level, and description are copied onto the
+        event, and its reviewer is recorded as ``metadata["reviewer"]``
+        (extra *metadata* entries are merged on top).
+        """
+        meta = {"reviewer": flag.reviewer}
+        if metadata:
+            meta.update(metadata)
+        return cls(
+            event_type=event_type,
+            use_case_name=use_case_name,
+            dimension=flag.dimension.name,
+            level=flag.level.name,
+            description=flag.description,
+            actor=actor,
+            metadata=meta,
+        )
+
+    def _fields_dict(self) -> dict[str, Any]:
+        """``to_dict()`` minus ``metadata``, built once per field assignment."""
+        cached = self._dict_cache
+        if cached is None:
+            cached = {
+                "event_type": self.event_type.value,
+                "use_case_name": self.use_case_name,
+                "dimension": self.dimension,
+                "level": self.level,
+                "description": self.description,
+                "actor": self.actor,
+                "timestamp": self.timestamp.isoformat(),
+            }
+            object.__setattr__(self, "_dict_cache", cached)
+        return cached
+
     def to_dict(self) -> dict[str, Any]:
-        """Serialize for logging, webhooks, or SIEM ingestion."""
-        return {
-            "event_type": self.event_type.value,
-            "use_case_name": self.use_case_name,
-            "dimension": self.dimension,
-            "level": self.level,
-            "description": self.description,
-            "actor": self.actor,
-            "timestamp": self.timestamp.isoformat(),
-            "metadata": dict(self.metadata),
-        }
+        """Serialize for logging, webhooks, or SIEM ingestion.
+
+        Returns a new dict (with its own copy of ``metadata``) on every
+        call, so callers may modify the result freely.
+        """
+        d = dict(self._fields_dict())
+        d["metadata"] = dict(self.metadata)
+        return d
+
+    def to_json_bytes(self) -> bytes:
+        """UTF-8 JSON encoding of :meth:`to_dict`.
+
+        Uses ``orjson`` when it is installed.  Everything but ``metadata``
+        is encoded once per event.  ``metadata`` is re-encoded on each call,
+        so in-place edits to it are always reflected; while it is unchanged,
+        every caller (e.g. each hook) gets the same bytes object.
+        """
+        meta = _encode_json(self.metadata)
+        cached = self._json_cache
+        if cached is not None and cached[1] == meta:
+            return cached[2]
+        fields = cached[0] if cached is not None else _encode_json(self._fields_dict())
+        # Re-open the encoded fields to append metadata as the last key.
+        encoded = fields[:-1] + b',"metadata":' + meta + b"}"
+        object.__setattr__(self, "_json_cache", (fields, meta, encoded))
+        return encoded
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode values JSON has no type for, the same way for both backends."""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, date):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _encode_json(obj: Any) -> bytes:
+    """Compact UTF-8 JSON, via orjson when available.
+
+    The output is byte-for-byte the same with or without orjson: dates and
+    times go through :func:`_json_default` on both paths, and non-ASCII
+    text is written as raw UTF-8.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=_json_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+    return json.dumps(
+        obj, default=_json_default, ensure_ascii=False, separators=(",", ":")
+    ).encode()
 
 
 # ---------------------------------------------------------------------------
@@ -155,32 +285,51 @@ class GovernanceHook:
 # Hook registry
 # ---------------------------------------------------------------------------
 
-_hooks: list[GovernanceHook] = []
-
-
-def register_hook(hook: GovernanceHook) -> None:
-    """Register a governance hook to receive lifecycle events."""
-    if hook not in _hooks:
-        _hooks.append(hook)
+class DispatchMode(Enum):
+    """How emit_governance_event() delivers events to a registered hook.
 
+    SYNC             Call the hook on the emitting thread (the default).
+                     Exceptions propagate to the emitter.
+    THREAD_POOL      Submit each event to a thread pool; events may reach
+                     the hook concurrently and out of order.
+    FIRE_AND_FORGET  Queue events for a single background thread, which
+                     delivers them in emission order.
 
-def unregister_hook(hook: GovernanceHook) -> bool:
-    """Remove a governance hook. Returns True if it was registered."""
-    try:
-        _hooks.remove(hook)
-        return True
-    except ValueError:
-        return False
-
-
-def clear_hooks() -> None:
-    """Remove all registered governance hooks."""
-    _hooks.clear()
+    Hooks in the two background modes receive the same event object the
+    emitter holds, so emitters must not modify an event after emitting it.
+    Their exceptions are collected and returned by flush_async_hooks().
+    """
+    SYNC = "sync"
+    THREAD_POOL = "thread_pool"
+    FIRE_AND_FORGET = "fire_and_forget"
 
 
-def registered_hooks() -> list[GovernanceHook]:
-    """Return a copy of the currently registered hooks."""
-    return list(_hooks)
+_hooks: list[GovernanceHook] = []
+# id() of every hook in ``_hooks``, for O(1) duplicate checks without
+# requiring hooks to be hashable.
+_hook_ids: set[int] = set()
+# Guards every registry change.  Dispatch reads the prebuilt tables and
+# does not take it.
+_registry_lock = threading.RLock()
+
+# id(hook) -> (mode, executor) for hooks registered with a non-default mode
+_hook_modes: dict[int, tuple[DispatchMode, Optional[Executor]]] = {}
+
+# Immutable copy of ``_hooks`` and a counter bumped on every registry change
+# so callers can tell when a snapshot they hold is stale.
+_hooks_snapshot: tuple[GovernanceHook, ...] = ()
+_hooks_version = 0
+
+# Event type -> one (handler, on_event, submit) triple per registered hook
+# that handles that type, in registration order: the hook's bound ``on_*``
+# method for the type and its bound ``on_event`` (either None when the hook
+# does not override it), and how to run it off-thread (None for SYNC hooks).
+# Hooks that override neither are left out of the type's bucket entirely.
+# Rebuilt on every registry change; read by emit_governance_event().
+_Handler = Callable[["GovernanceEvent"], None]
+_Submit = Callable[..., Any]
+_DispatchTriple = tuple[Optional[_Handler], Optional[_Handler], Optional[_Submit]]
+_dispatch_by_type: dict[GovernanceEventType, tuple[_DispatchTriple, ...]] = {}
 
 
 _DISPATCH: dict[GovernanceEventType, str] = {
@@ -196,23 +345,260 @@ _DISPATCH: dict[GovernanceEventType, str] = {
 }
 
 
+# -- Background delivery ----------------------------------------------------
+
+_async_lock = threading.Lock()
+_default_executor: Optional[ThreadPoolExecutor] = None
+_pending_futures: set[Future] = set()
+_fire_and_forget_queue: queue.Queue = queue.Queue()
+_fire_and_forget_worker: Optional[threading.Thread] = None
+# Exceptions raised by background hooks since the last flush_async_hooks()
+_async_errors: list[Exception] = []
+
+
+def _deliver(
+    handler: Optional[_Handler], on_event: Optional[_Handler], event: GovernanceEvent
+) -> None:
+    if handler is not None:
+        handler(event)
+    if on_event is not None:
+        on_event(event)
+
+
+def _future_done(future: Future) -> None:
+    with _async_lock:
+        _pending_futures.discard(future)
+        if not future.cancelled() and future.exception() is not None:
+            _async_errors.append(future.exception())
+
+
+def _pool_submitter(executor: Optional[Executor]) -> _Submit:
+    global _default_executor
+    if executor is None:
+        with _async_lock:
+            if _default_executor is None:
+                _default_executor = ThreadPoolExecutor(
+                    max_workers=min(8, os.cpu_count() or 1),
+                    thread_name_prefix="governance-hook",
+                )
+            executor = _default_executor
+
+    def submit(*args: Any) -> None:
+        future = executor.submit(_deliver, *args)
+        with _async_lock:
+            _pending_futures.add(future)
+        future.add_done_callback(_future_done)
+
+    return submit
+
+
+def _drain_fire_and_forget() -> None:
+    pending = _fire_and_forget_queue
+    while True:
+        args = pending.get()
+        try:
+            _deliver(*args)
+        except Exception as exc:
+            with _async_lock:
+                _async_errors.append(exc)
+        finally:
+            pending.task_done()
+
+
+def _enqueue(*args: Any) -> None:
+    _fire_and_forget_queue.put_nowait(args)
+
+
+def _fire_and_forget_submitter() -> _Submit:
+    global _fire_and_forget_worker
+    with _async_lock:
+        if _fire_and_forget_worker is None:
+            _fire_and_forget_worker = threading.Thread(
+                target=_drain_fire_and_forget,
+                name="governance-hook-queue",
+                daemon=True,
+            )
+            _fire_and_forget_worker.start()
+    return _enqueue
+
+
+def flush_async_hooks() -> list[Exception]:
+    """Wait for events handed to background hooks to be delivered.
+
+    Returns the exceptions those hooks raised since the previous flush.
+    Call before shutdown, or in tests before asserting on hook effects.
+    """
+    while True:
+        with _async_lock:
+            futures = list(_pending_futures)
+        if not futures:
+            break
+        futures_wait(futures)
+    _fire_and_forget_queue.join()
+    with _async_lock:
+        errors = list(_async_errors)
+        _async_errors.clear()
+    return errors
+
+
+# -- Registration -------------------------------------------------------------
+
+def _bound_handler(hook: GovernanceHook, method_name: str) -> Optional[_Handler]:
+    """Return ``hook.<method_name>``, or None if it is the base-class no-op."""
+    handler = getattr(hook, method_name)
+    if getattr(handler, "__func__", None) is getattr(GovernanceHook, method_name):
+        return None
+    return handler
+
+
+def _dispatch_entry(
+    hook: GovernanceHook,
+) -> tuple[dict[GovernanceEventType, _Handler], Optional[_Handler], Optional[_Submit]]:
+    handlers: dict[GovernanceEventType, _Handler] = {}
+    for event_type, method_name in _DISPATCH.items():
+        handler = _bound_handler(hook, method_name)
+        if handler is not None:
+            handlers[event_type] = handler
+    mode, executor = _hook_modes.get(id(hook), (DispatchMode.SYNC, None))
+    if mode is DispatchMode.THREAD_POOL:
+        submit: Optional[_Submit] = _pool_submitter(executor)
+    elif mode is DispatchMode.FIRE_AND_FORGET:
+        submit = _fire_and_forget_submitter()
+    else:
+        submit = None
+    return handlers, _bound_handler(hook, "on_event"), submit
+
+
+def _hooks_changed() -> None:
+    global _hooks_snapshot, _hooks_version, _dispatch_by_type
+    _hooks_snapshot = tuple(_hooks)
+    entries = [_dispatch_entry(hook) for hook in _hooks_snapshot]
+    by_type: dict[GovernanceEventType, tuple[_DispatchTriple, ...]] = {}
+    for event_type in GovernanceEventType:
+        bucket = []
+        for handlers, on_event, submit in entries:
+            handler = handlers.get(event_type)
+            if handler is not None or on_event is not None:
+                bucket.append((handler, on_event, submit))
+        by_type[event_type] = tuple(bucket)
+    _dispatch_by_type = by_type
+    _hooks_version += 1
+
+
+def register_hook(
+    hook: GovernanceHook,
+    mode: DispatchMode = DispatchMode.SYNC,
+    executor: Optional[Executor] = None,
+) -> None:
+    """Register a governance hook to receive lifecycle events.
+
+    ``mode`` selects how events are delivered (see :class:`DispatchMode`);
+    ``executor`` overrides the shared thread pool used for THREAD_POOL
+    hooks.  Registering a hook that is already registered does nothing.
+
+    The hook's handler methods are looked up once, here; methods patched
+    onto a hook after registration are not seen until it is re-registered.
+    """
+    with _registry_lock:
+        if id(hook) in _hook_ids:
+            return
+        _hooks.append(hook)
+        _hook_ids.add(id(hook))
+        if mode is not DispatchMode.SYNC:
+            _hook_modes[id(hook)] = (mode, executor)
+        _hooks_changed()
+
+
+def unregister_hook(hook: GovernanceHook) -> bool:
+    """Remove a governance hook. Returns True if it was registered."""
+    with _registry_lock:
+        if id(hook) not in _hook_ids:
+            return False
+        for i, registered in enumerate(_hooks):
+            if registered is hook:
+                del _hooks[i]
+                break
+        _hook_ids.discard(id(hook))
+        _hook_modes.pop(id(hook), None)
+        _hooks_changed()
+    return True
+
+
+def clear_hooks() -> None:
+    """Remove all registered governance hooks."""
+    with _registry_lock:
+        _hooks.clear()
+        _hook_ids.clear()
+        _hook_modes.clear()
+        _hooks_changed()
+
+
+def registered_hooks() -> list[GovernanceHook]:
+    """Return a copy of the currently registered hooks."""
+    return list(_hooks_snapshot)
+
+
 def emit_governance_event(event: GovernanceEvent) -> None:
     """Dispatch a governance event to all registered hooks.
 
     Calls the specific ``on_*`` method for the event type, then always
-    calls ``on_event`` as a catch-all.
+    calls ``on_event`` as a catch-all.  Hooks registered or removed while
+    an event is being dispatched take effect from the next event.  Hooks
+    registered with a background :class:`DispatchMode` are handed the
+    event and run later; this call does not wait for them.
     """
-    method_name = _DISPATCH.get(event.event_type)
-    for hook in _hooks:
-        if method_name:
-            getattr(hook, method_name)(event)
-        hook.on_event(event)
+    for handler, on_event, submit in _dispatch_by_type.get(event.event_type, ()):
+        if submit is None:
+            if handler is not None:
+                handler(event)
+            if on_event is not None:
+                on_event(event)
+        else:
+            submit(handler, on_event, event)
 
 
 # ---------------------------------------------------------------------------
 # Built-in adapters
 # ---------------------------------------------------------------------------
 
+class _AuditIndex:
+    """Positions of AuditLogger entries by event type and use case.
+
+    Extended lazily from the end of the log on each query, so entries
+    appended directly to ``AuditLogger.log`` are indexed too; replacing or
+    shrinking the log triggers a rebuild.
+    """
+
+    __slots__ = ("source", "size", "by_type", "by_use_case", "timestamps", "ordered")
+
+    def __init__(self, log: list[dict[str, Any]]):
+        self.source = log
+        self.size = 0
+        self.by_type: dict[str, list[int]] = {}
+        self.by_use_case: dict[str, list[int]] = {}
+        # ISO timestamps in log order; ``ordered`` while non-decreasing,
+        # which lets ``since`` filters bisect instead of scanning.
+        self.timestamps: list[str] = []
+        self.ordered = True
+
+    def catch_up(self) -> None:
+        log = self.source
+        timestamps = self.timestamps
+        for pos in range(self.size, len(log)):
+            entry = log[pos]
+            self.by_type.setdefault(entry["event_type"], []).append(pos)
+            self.by_use_case.setdefault(entry["use_case_name"], []).append(pos)
+            stamp = entry["timestamp"]
+            if timestamps and stamp < timestamps[-1]:
+                self.ordered = False
+            timestamps.append(stamp)
+        self.size = len(log)
+
+
+# Queued by AuditLogger.close() to stop the background delivery thread.
+_CLOSE_SINK = object()
+
+
 class AuditLogger(GovernanceHook):
     """Structured audit logger that records all governance events.
 
@@ -223,17 +609,146 @@ class AuditLogger(GovernanceHook):
             requests.post(SPLUNK_URL, json=event_dict)
 
         logger = AuditLogger(sink=send_to_splunk)
+
+    Sinks are called synchronously on the emitting thread.  For slow sinks
+    (HTTP collectors, SIEM ingestion) pass ``async_sink=True`` to hand
+    entries to a background thread instead; it delivers them in batches of
+    up to ``batch_size`` entries, waiting at most ``flush_interval``
+    seconds for a batch to fill.  A ``batch_sink`` receives each batch as a
+    list, otherwise ``sink`` is called once per entry::
+
+        logger = AuditLogger(
+            batch_sink=lambda batch: requests.post(SPLUNK_URL, json=batch),
+            async_sink=True,
+        )
+        ...
+        logger.close()  # deliver anything still queued
+
+    ``self.log`` is always updated synchronously.  Exceptions raised by a
+    sink on the background thread are kept in ``sink_errors``.
+
+    ``sink`` may also be a text file opened for writing, in which case each
+    entry is written to it as one JSON line.  With ``auditable=True`` every
+    entry is delivered before the emitting call returns and, for file
+    sinks, flushed and ``os.fsync``-ed as well — one disk sync per event,
+    so use it where durability matters more than throughput (legal hold,
+    regulated audit trails)::
+
+        logger = AuditLogger(sink=open("audit.jsonl", "a"), auditable=True)
+
+    ``auditable`` cannot be combined with ``async_sink``.
     """
 
-    def __init__(self, sink: Optional[Callable[[dict[str, Any]], None]] = None):
+    def __init__(
+        self,
+        sink: Union[Callable[[dict[str, Any]], None], IO[str], None] = None,
+        *,
+        batch_sink: Optional[Callable[[list[dict[str, Any]]], None]] = None,
+        async_sink: bool = False,
+        batch_size: int = 64,
+        flush_interval: float = 0.5,
+        auditable: bool = False,
+    ):
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        if auditable and async_sink:
+            raise ValueError("auditable=True requires synchronous delivery; "
+                             "drop async_sink=True")
         self.log: list[dict[str, Any]] = []
+        self._index: Optional[_AuditIndex] = None
+        self.auditable = auditable
+        self._file: Optional[IO[str]] = None
+        if sink is not None and not callable(sink):
+            self._file = sink
+            sink = self._write_line
         self._sink = sink
+        self._batch_sink = batch_sink
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self.sink_errors: list[Exception] = []
+        self._queue: Optional[queue.Queue] = None
+        self._worker: Optional[threading.Thread] = None
+        if async_sink and (sink is not None or batch_sink is not None):
+            self._queue = queue.Queue()
+            self._worker = threading.Thread(
+                target=self._drain, name="AuditLogger-sink", daemon=True
+            )
+            self._worker.start()
 
     def on_event(self, event: GovernanceEvent) -> None:
         entry = event.to_dict()
         self.log.append(entry)
-        if self._sink is not None:
+        if self._queue is not None:
+            self._queue.put_nowait(entry)
+        elif self._batch_sink is not None:
+            self._batch_sink([entry])
+        elif self._sink is not None:
             self._sink(entry)
+        else:
+            return
+        if self.auditable and self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def _write_line(self, entry: dict[str, Any]) -> None:
+        self._file.write(json.dumps(entry, default=str) + "\n")
+
+    def _deliver(self, batch: list[dict[str, Any]]) -> None:
+        if self._batch_sink is not None:
+            self._batch_sink(batch)
+        else:
+            for entry in batch:
+                self._sink(entry)
+
+    def _drain(self) -> None:
+        """Background loop: collect queued entries into batches and deliver."""
+        pending = self._queue
+        while True:
+            item = pending.get()
+            batch: list[dict[str, Any]] = []
+            taken = 1
+            deadline = time.monotonic() + self._flush_interval
+            while item is not _CLOSE_SINK:
+                batch.append(item)
+                if len(batch) >= self._batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                try:
+                    item = (
+                        pending.get(timeout=remaining) if remaining > 0
+                        else pending.get_nowait()
+                    )
+                except queue.Empty:
+                    break
+                taken += 1
+            try:
+                if batch:
+                    self._deliver(batch)
+            except Exception as exc:  # keep draining; surface via sink_errors
+                self.sink_errors.append(exc)
+            finally:
+                for _ in range(taken):
+                    pending.task_done()
+            if item is _CLOSE_SINK:
+                return
+
+    def flush(self) -> None:
+        """Block until every queued entry has been handed to the sink."""
+        if self._queue is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Deliver any queued entries and stop the background thread.
+
+        Later events are still recorded in ``self.log`` and are delivered
+        synchronously.
+        """
+        if self._worker is None:
+            return
+        self._queue.put_nowait(_CLOSE_SINK)
+        self._worker.join()
+        self._queue = None
+        self._worker = None
 
     def query(
         self,
@@ -241,16 +756,63 @@ class AuditLogger(GovernanceHook):
         use_case_name: Optional[str] = None,
         since: Optional[datetime] = None,
     ) -> list[dict[str, Any]]:
-        """Query the audit log with optional filters."""
-        results = self.log
+        """Query the audit log with optional filters.
+
+        Filters are answered from an index of the log, so the cost scales
+        with the number of candidate entries rather than the log size.
+        """
+        if event_type is None and use_case_name is None and since is None:
+            return self.log
+        index = self._current_index()
+        log = self.log
+
+        candidates: Optional[list[int]] = None
         if event_type is not None:
-            results = [e for e in results if e["event_type"] == event_type.value]
+            type_value = event_type.value
+            candidates = index.by_type.get(type_value, [])
         if use_case_name is not None:
-            results = [e for e in results if e["use_case_name"] == use_case_name]
+            by_name = index.by_use_case.get(use_case_name, [])
+            if candidates is None:
+                candidates = by_name
+            elif len(by_name) < len(candidates):
+                candidates = [p for p in by_name if log[p]["event_type"] == type_value]
+            else:
+                candidates = [
+                    p for p in candidates if log[p]["use_case_name"] == use_case_name
+                ]
         if since is not None:
             cutoff = since.isoformat()
-            results = [e for e in results if e["timestamp"] >= cutoff]
-        return results
+            if not index.ordered:
+                positions = candidates if candidates is not None else range(len(log))
+                return [log[p] for p in positions if log[p]["timestamp"] >= cutoff]
+            first = bisect_left(index.timestamps, cutoff)
+            if candidates is None:
+                return log[first:]
+            candidates = candidates[bisect_left(candidates, first):]
+        return [log[pos] for pos in candidates]
+
+    def counts(self, group_by: str = "event_type") -> Counter[str]:
+        """Count log entries per value of the *group_by* field.
+
+        ``event_type`` and ``use_case_name`` are answered from the query
+        index; any other field is tallied in one pass over the log.
+        """
+        if group_by == "event_type":
+            groups = self._current_index().by_type
+        elif group_by == "use_case_name":
+            groups = self._current_index().by_use_case
+        else:
+            return Counter(entry.get(group_by) for entry in self.log)
+        return Counter({value: len(positions) for value, positions in groups.items()})
+
+    def _current_index(self) -> _AuditIndex:
+        """The query index, rebuilt if the log was replaced and brought up to date."""
+        index = self._index
+        log = self.log
+        if index is None or index.source is not log or index.size > len(log):
+            index = self._index = _AuditIndex(log)
+        index.catch_up()
+        return index
 
 
 class ComplianceGate(GovernanceHook):
@@ -271,16 +833,31 @@ class ComplianceGate(GovernanceHook):
         gate.evaluate(some_event)  # -> (True/False, [failed_names])
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        keep_results_log: bool = True,
+        emit_result_event: bool = True,
+    ):
         self._criteria: dict[str, Callable[[GovernanceEvent], bool]] = {}
+        # (name, fn) pairs in registration order, rebuilt when criteria change
+        self._criteria_items: tuple[
+            tuple[str, Callable[[GovernanceEvent], bool]], ...
+        ] = ()
+        self.keep_results_log = keep_results_log
+        self.emit_result_event = emit_result_event
         self.results_log: list[dict[str, Any]] = []
+        # Per-thread flag set while this gate's result event is dispatched.
+        self._dispatch_state = threading.local()
+
+    def _criteria_changed(self) -> None:
+        self._criteria_items = tuple(self._criteria.items())
 
     def criterion(
         self, name: str
     ) -> Callable[[Callable[[GovernanceEvent], bool]], Callable[[GovernanceEvent], bool]]:
         """Decorator to register a named compliance criterion."""
         def decorator(fn: Callable[[GovernanceEvent], bool]) -> Callable[[GovernanceEvent], bool]:
-            self._criteria[name] = fn
+            self.add_criterion(name, fn)
             return fn
         return decorator
 
@@ -289,35 +866,59 @@ class ComplianceGate(GovernanceHook):
     ) -> None:
         """Register a compliance criterion directly."""
         self._criteria[name] = fn
+        self._criteria_changed()
 
     def remove_criterion(self, name: str) -> bool:
         """Remove a criterion by name. Returns True if it existed."""
-        return self._criteria.pop(name, None) is not None
+        if self._criteria.pop(name, None) is None:
+            return False
+        self._criteria_changed()
+        return True
 
     @property
     def criteria_names(self) -> list[str]:
         """Names of all registered criteria."""
         return list(self._criteria.keys())
 
-    def evaluate(self, event: GovernanceEvent) -> tuple[bool, list[str]]:
+    def evaluate(
+        self, event: GovernanceEvent, fail_fast: bool = False
+    ) -> tuple[bool, list[str]]:
         """Evaluate all criteria against an event.
 
+        With ``fail_fast=True`` evaluation stops at the first failing
+        criterion, so the failed list names only that one.  The result is
+        recorded in ``results_log`` unless the gate was created with
+        ``keep_results_log=False``.
+
+        A COMPLIANCE_GATE_PASSED / _FAILED event is then emitted to all
+        hooks, unless the gate was created with ``emit_result_event=False``
+        or the call comes from a hook handling this gate's own result event
+        (which would otherwise recurse).
+
         Returns:
             A tuple of (passed: bool, failed_criteria: list[str]).
         """
         failed: list[str] = []
-        for name, fn in self._criteria.items():
+        for name, fn in self._criteria_items:
             if not fn(event):
                 failed.append(name)
+                if fail_fast:
+                    break
 
         passed = len(failed) == 0
-        result = {
-            "event": event.to_dict(),
-            "passed": passed,
-            "failed_criteria": failed,
-            "evaluated_at": datetime.now().isoformat(),
-        }
-        self.results_log.append(result)
+        if self.keep_results_log:
+            self.results_log.append({
+                "event": event.to_dict(),
+                "passed": passed,
+                "failed_criteria": failed,
+                "evaluated_at": datetime.now().isoformat(),
+            })
+
+        if not self.emit_result_event:
+            return passed, failed
+        state = self._dispatch_state
+        if getattr(state, "active", False):
+            return passed, failed
 
         # Emit sub-event for compliance gate result
         gate_event = GovernanceEvent(
@@ -331,7 +932,11 @@ class ComplianceGate(GovernanceHook):
             actor="compliance_gate",
             metadata={"source_event": event.event_type.value, "failed": failed},
         )
-        emit_governance_event(gate_event)
+        state.active = True
+        try:
+            emit_governance_event(gate_event)
+        finally:
+            state.active = False
 
         return passed, failed
 
@@ -354,19 +959,30 @@ class NotificationBridge(GovernanceHook):
             callback=slack_notify,
             event_filter=lambda e: e.level in ("HIGH", "CRITICAL"),
         )
+
+    Pass ``encoded=True`` to receive the event as UTF-8 JSON bytes instead
+    of a dict — ready to use as an HTTP request body, and encoded only once
+    per event however many bridges forward it::
+
+        bridge = NotificationBridge(
+            callback=lambda body: requests.post(SIEM_URL, data=body),
+            encoded=True,
+        )
     """
 
     def __init__(
         self,
-        callback: Callable[[dict[str, Any]], None],
+        callback: Callable[[Any], None],
         event_filter: Optional[Callable[[GovernanceEvent], bool]] = None,
+        encoded: bool = False,
     ):
         self._callback = callback
         self._filter = event_filter
+        self._encoded = encoded
         self.sent_count: int = 0
 
     def on_event(self, event: GovernanceEvent) -> None:
         if self._filter is not None and not self._filter(event):
             return
-        self._callback(event.to_dict())
+        self._callback(event.to_json_bytes() if self._encoded else event.to_dict())
         self.sent_count += 1
@@ -26,7 +26,9 @@ Usage::
 
 from __future__ import annotations
 
-from typing import Optional
+from collections import ChainMap
+from types import MappingProxyType
+from typing import Iterable, Mapping, Optional
 
 from ai_use_case_context.core import (
     Dimension,
@@ -230,10 +232,12 @@ ENTERPRISE_ROUTING: dict[tuple[DimensionType, RiskLevel], str] = {
 # Preset registry
 # ---------------------------------------------------------------------------
 
-_PRESETS: dict[str, tuple[list[Dimension], dict]] = {
-    "tpn": (TPN_DIMENSIONS, TPN_ROUTING),
-    "vfx": (VFX_DIMENSIONS, VFX_ROUTING),
-    "enterprise": (ENTERPRISE_DIMENSIONS, ENTERPRISE_ROUTING),
+# Routing tables are held as read-only views: security_profile() reads them
+# directly instead of copying each one per call.
+_PRESETS: dict[str, tuple[list[Dimension], Mapping]] = {
+    "tpn": (TPN_DIMENSIONS, MappingProxyType(TPN_ROUTING)),
+    "vfx": (VFX_DIMENSIONS, MappingProxyType(VFX_ROUTING)),
+    "enterprise": (ENTERPRISE_DIMENSIONS, MappingProxyType(ENTERPRISE_ROUTING)),
 }
 
 
@@ -256,7 +260,7 @@ def register_preset(
         register_preset("studio_custom", MY_DIMS, MY_ROUTING)
         profile = security_profile("tpn", "studio_custom")
     """
-    _PRESETS[name] = (dimensions, routing)
+    _PRESETS[name] = (dimensions, MappingProxyType(routing))
 
 
 def unregister_preset(name: str) -> bool:
@@ -293,15 +297,7 @@ class SecurityProfile:
 
     def merge(self, other: SecurityProfile) -> SecurityProfile:
         """Return a new profile that combines both profiles."""
-        seen_names: set[str] = set()
-        merged_dims: list[Dimension] = []
-        for dim in self.dimensions + other.dimensions:
-            if dim.name not in seen_names:
-                seen_names.add(dim.name)
-                merged_dims.append(dim)
-        merged_routing = {**self.routing, **other.routing}
-        merged_presets = list(dict.fromkeys(self.presets + other.presets))
-        return SecurityProfile(merged_dims, merged_routing, merged_presets)
+        return _combine((self, other))
 
     def __repr__(self) -> str:
         return (
@@ -320,7 +316,7 @@ def security_profile(*preset_names: str) -> SecurityProfile:
 
     Raises ``KeyError`` if a preset name is not recognized.
     """
-    profile = SecurityProfile()
+    profiles: list[SecurityProfile] = []
     for name in preset_names:
         key = name.lower()
         if key not in _PRESETS:
@@ -329,9 +325,25 @@ def security_profile(*preset_names: str) -> SecurityProfile:
                 f"Available: {list(_PRESETS.keys())}"
             )
         dims, routing = _PRESETS[key]
-        other = SecurityProfile(list(dims), dict(routing), [key])
-        profile = profile.merge(other)
-    return profile
+        profiles.append(SecurityProfile(dims, routing, [key]))
+    return _combine(profiles)
+
+
+def _combine(profiles: Iterable[SecurityProfile]) -> SecurityProfile:
+    """Merge profiles in one pass.
+
+    Dimensions are de-duplicated by name (first wins), routing entries from
+    later profiles take precedence, and preset names keep first-seen order.
+    """
+    dims: dict[str, Dimension] = {}
+    routing: dict[tuple[DimensionType, RiskLevel], str] = {}
+    presets: dict[str, None] = {}
+    for profile in profiles:
+        for dim in profile.dimensions:
+            dims.setdefault(dim.name, dim)
+        routing.update(profile.routing)
+        presets.update(dict.fromkeys(profile.presets))
+    return SecurityProfile(list(dims.values()), routing, list(presets))
 
 
 def apply_security_profile(
@@ -341,6 +353,17 @@ def apply_security_profile(
     """Apply a :class:`SecurityProfile` to a use case.
 
     Merges the profile's routing table into the context's existing routing
-    table (profile entries take precedence for overlapping keys).
+    table (profile entries take precedence for overlapping keys).  The
+    result is a two-layer ``ChainMap``: a private dict holding every
+    profile applied so far, over the shared base table, which is not copied
+    per context.
     """
-    ctx.routing_table = {**ctx.routing_table, **profile.routing}
+    # Never update the existing table in place: contexts share
+    # DEFAULT_ROUTING (and possibly other tables) by reference.  Re-applying
+    # merges into the private top layer rather than stacking new layers.
+    table = ctx.routing_table
+    if isinstance(table, ChainMap):
+        top, *base = table.maps
+    else:
+        top, base = {}, [table]
+    ctx.routing_table = ChainMap({**top, **profile.routing}, *base)
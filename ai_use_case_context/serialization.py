@@ -3,13 +3,27 @@ Serialization utilities for the AI Use Case Context Framework.
 
 Provides JSON/dict round-trip serialization for UseCaseContext objects,
 enabling integration with external systems, databases, and APIs.
+
+JSON encoding uses ``orjson`` when it is installed and falls back to the
+standard library otherwise; the output is the same either way.  ``to_msgpack`` / ``from_msgpack`` require
+``msgpack``.  Both are available via ``pip install ai-use-case-context[fast]``.
 """
 
 from __future__ import annotations
 
 import json
 from datetime import datetime
-from typing import Any, Optional
+from typing import IO, Any, Iterable, Iterator, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
 
 from ai_use_case_context.core import (
     RiskDimension,
@@ -20,19 +34,31 @@ from ai_use_case_context.core import (
     Dimension,
 )
 
-_DATETIME_FMT = "%Y-%m-%dT%H:%M:%S.%f"
+# Enum members by name: a plain dict lookup per field instead of a trip
+# through the enum metaclass.  Unknown level/status names still raise
+# KeyError; unknown dimension names are restored as custom dimensions.
+_DIMENSIONS_BY_NAME: dict[str, RiskDimension] = dict(RiskDimension.__members__)
+_LEVELS_BY_NAME: dict[str, RiskLevel] = dict(RiskLevel.__members__)
+_STATUSES_BY_NAME: dict[str, ReviewStatus] = dict(ReviewStatus.__members__)
 
 
 def _serialize_datetime(dt: Optional[datetime]) -> Optional[str]:
+    # Always include microseconds so the wire format stays fixed-width
+    # ("2025-01-01T09:30:00.000000"), as it was with strftime.
     if dt is None:
         return None
-    return dt.strftime(_DATETIME_FMT)
+    return dt.isoformat(timespec="microseconds")
 
 
 def _deserialize_datetime(s: Optional[str]) -> Optional[datetime]:
     if s is None:
         return None
-    return datetime.strptime(s, _DATETIME_FMT)
+    dt = datetime.fromisoformat(s)
+    # Timestamps are naive local time throughout (escalation compares them
+    # with datetime.now()); the old strptime format rejected offsets too.
+    if dt.tzinfo is not None:
+        raise ValueError(f"timezone-aware timestamp not supported: {s!r}")
+    return dt
 
 
 def _flag_to_dict(flag: RiskFlag) -> dict[str, Any]:
@@ -55,38 +81,43 @@ def _flag_to_dict(flag: RiskFlag) -> dict[str, Any]:
 def _deserialize_dimension(data: dict[str, Any]):
     """Restore a dimension from serialized data — built-in or custom."""
     name = data["dimension"]
-    try:
-        return RiskDimension[name]
-    except KeyError:
-        label = data.get("dimension_label", name)
-        return Dimension(name, label)
+    dimension = _DIMENSIONS_BY_NAME.get(name)
+    if dimension is None:
+        dimension = Dimension(name, data.get("dimension_label", name))
+    return dimension
 
 
 def _flag_from_dict(data: dict[str, Any]) -> RiskFlag:
     return RiskFlag(
         dimension=_deserialize_dimension(data),
-        level=RiskLevel[data["level"]],
+        level=_LEVELS_BY_NAME[data["level"]],
         description=data["description"],
         reviewer=data.get("reviewer", ""),
-        status=ReviewStatus[data["status"]],
+        status=_STATUSES_BY_NAME[data["status"]],
         resolution_notes=data.get("resolution_notes", ""),
         created_at=_deserialize_datetime(data["created_at"]) or datetime.now(),
         resolved_at=_deserialize_datetime(data.get("resolved_at")),
     )
 
 
-def to_dict(ctx: UseCaseContext) -> dict[str, Any]:
-    """Serialize a UseCaseContext to a plain dict."""
+def _context_fields(ctx: UseCaseContext) -> dict[str, Any]:
+    """Everything in ``to_dict`` except the flags, which always come last."""
     return {
         "name": ctx.name,
         "description": ctx.description,
         "workflow_phase": ctx.workflow_phase,
         "tags": list(ctx.tags),
         "created_at": _serialize_datetime(ctx.created_at),
-        "risk_flags": [_flag_to_dict(f) for f in ctx.risk_flags],
     }
 
 
+def to_dict(ctx: UseCaseContext) -> dict[str, Any]:
+    """Serialize a UseCaseContext to a plain dict."""
+    d = _context_fields(ctx)
+    d["risk_flags"] = [_flag_to_dict(f) for f in ctx.risk_flags]
+    return d
+
+
 def from_dict(
     data: dict[str, Any],
     routing_table: Optional[dict] = None,
@@ -98,21 +129,123 @@ def from_dict(
         workflow_phase=data.get("workflow_phase", ""),
         tags=data.get("tags", []),
         routing_table=routing_table,
+        created_at=_deserialize_datetime(data.get("created_at")),
     )
-    ctx.created_at = _deserialize_datetime(data.get("created_at")) or datetime.now()
-    for flag_data in data.get("risk_flags", []):
-        ctx.risk_flags.append(_flag_from_dict(flag_data))
+    flag_from_dict = _flag_from_dict
+    ctx.risk_flags = [flag_from_dict(fd) for fd in data.get("risk_flags", ())]
     return ctx
 
 
-def to_json(ctx: UseCaseContext, indent: int = 2) -> str:
-    """Serialize a UseCaseContext to a JSON string."""
-    return json.dumps(to_dict(ctx), indent=indent)
+def from_dict_many(
+    items: Iterable[dict[str, Any]],
+    routing_table: Optional[dict] = None,
+) -> list[UseCaseContext]:
+    """Deserialize a batch of UseCaseContexts, e.g. a bulk export.
+
+    Equivalent to calling :func:`from_dict` on each item with the same
+    ``routing_table``.
+    """
+    return [from_dict(data, routing_table) for data in items]
+
+
+def to_json(ctx: UseCaseContext, indent: Optional[int] = 2) -> str:
+    """Serialize a UseCaseContext to a JSON string.
+
+    The text is exactly what ``json.dumps(to_dict(ctx), indent=indent)``
+    produces, non-ASCII characters escaped.  orjson is used for the default
+    2-space indent when the result is pure ASCII (where the two encoders
+    agree byte for byte); anything else goes through the standard library.
+    """
+    data = to_dict(ctx)
+    if orjson is not None and indent == 2:
+        encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        if encoded.isascii():
+            return encoded.decode()
+    return json.dumps(data, indent=indent)
+
+
+def to_json_bytes(ctx: UseCaseContext, indent: Optional[int] = None) -> bytes:
+    """Serialize a UseCaseContext to UTF-8 JSON bytes.
+
+    Compact by default, for request bodies and storage.  Unlike ``to_json``,
+    non-ASCII text is written as raw UTF-8 rather than ``\\u`` escapes, with
+    or without orjson.  With orjson installed the bytes come straight from
+    the encoder, skipping the str round trip.
+    """
+    data = to_dict(ctx)
+    if orjson is not None and indent in (None, 2):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    separators = (",", ":") if indent is None else None
+    return json.dumps(
+        data, indent=indent, separators=separators, ensure_ascii=False,
+    ).encode()
+
+
+def dump(ctx: UseCaseContext, fp: IO[str], indent: Optional[int] = 2) -> None:
+    """Write a UseCaseContext as JSON to a text file object.
+
+    The text is identical to ``to_json(ctx, indent)``, but is written in
+    pieces rather than built as one string first.
+    """
+    json.dump(to_dict(ctx), fp, indent=indent)
+
+
+def iter_chunks(ctx: UseCaseContext) -> Iterator[bytes]:
+    """Yield a UseCaseContext as compact UTF-8 JSON, one flag at a time.
+
+    Joined, the chunks decode to the same document as ``to_json_bytes``.
+    Only one flag is encoded at a time, so a large context can be streamed
+    to a file or an HTTP upload without holding the whole payload::
+
+        with open("export.json", "wb") as fh:
+            fh.writelines(iter_chunks(ctx))
+    """
+    encode = _encode_compact
+    fields = encode(_context_fields(ctx))
+    # Re-open the encoded object to append the flag list as the last key.
+    yield fields[:-1] + b',"risk_flags":['
+    first = True
+    for flag in ctx.risk_flags:
+        chunk = encode(_flag_to_dict(flag))
+        yield chunk if first else b"," + chunk
+        first = False
+    yield b"]}"
+
+
+def _encode_compact(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
 
 
 def from_json(
-    json_str: str,
+    json_str: Union[str, bytes],
+    routing_table: Optional[dict] = None,
+) -> UseCaseContext:
+    """Deserialize a UseCaseContext from a JSON string or UTF-8 bytes."""
+    loads = orjson.loads if orjson is not None else json.loads
+    return from_dict(loads(json_str), routing_table=routing_table)
+
+
+def to_msgpack(ctx: UseCaseContext) -> bytes:
+    """Serialize a UseCaseContext to MessagePack bytes.
+
+    The payload has the same shape as ``to_dict``.  Requires ``msgpack``.
+    """
+    if msgpack is None:
+        raise ImportError(
+            "to_msgpack() requires msgpack: pip install ai-use-case-context[fast]"
+        )
+    return msgpack.packb(to_dict(ctx), use_bin_type=True)
+
+
+def from_msgpack(
+    data: bytes,
     routing_table: Optional[dict] = None,
 ) -> UseCaseContext:
-    """Deserialize a UseCaseContext from a JSON string."""
-    return from_dict(json.loads(json_str), routing_table=routing_table)
+    """Deserialize a UseCaseContext from MessagePack bytes."""
+    if msgpack is None:
+        raise ImportError(
+            "from_msgpack() requires msgpack: pip install ai-use-case-context[fast]"
+        )
+    return from_dict(msgpack.unpackb(data, raw=False), routing_table=routing_table)
@@ -42,9 +42,10 @@ def main():
     print()
 
     # Simulate flags being created days ago
-    ctx.risk_flags[0].created_at = datetime.now() - timedelta(days=5)  # MEDIUM, >3d
-    ctx.risk_flags[1].created_at = datetime.now() - timedelta(days=10)  # LOW, >7d
-    ctx.risk_flags[2].created_at = datetime.now() - timedelta(days=2)  # HIGH, >1d
+    now = datetime.now()
+    ctx.risk_flags[0].created_at = now - timedelta(days=5)  # MEDIUM, >3d
+    ctx.risk_flags[1].created_at = now - timedelta(days=10)  # LOW, >7d
+    ctx.risk_flags[2].created_at = now - timedelta(days=2)  # HIGH, >1d
 
     # Create an escalation policy and apply it
     policy = EscalationPolicy()
@@ -31,7 +31,6 @@ def main():
         RiskDimension.BIAS, RiskLevel.MEDIUM,
         "AI may alter skin tones or facial features",
     )
-    dashboard.register(uc1)
 
     # --- Use Case 2: AI Color Grading ---
     uc2 = UseCaseContext(
@@ -43,7 +42,6 @@ def main():
         RiskDimension.FEASIBILITY, RiskLevel.MEDIUM,
         "Color model not validated on HDR10+ pipeline",
     )
-    dashboard.register(uc2)
 
     # --- Use Case 3: AI Script Analysis ---
     uc3 = UseCaseContext(
@@ -59,7 +57,6 @@ def main():
         RiskDimension.BIAS, RiskLevel.HIGH,
         "Potential bias in genre and demographic scoring",
     )
-    dashboard.register(uc3)
 
     # --- Use Case 4: AI Background Generation ---
     uc4 = UseCaseContext(
@@ -75,7 +72,8 @@ def main():
         RiskDimension.QUALITY, RiskLevel.LOW,
         "Resolution adequate for mid-ground but not hero shots",
     )
-    dashboard.register(uc4)
+
+    dashboard.register_many([uc1, uc2, uc3, uc4])
 
     # --- Print the portfolio summary ---
     print(dashboard.summary())
@@ -97,10 +95,10 @@ def main():
     print("BY WORKFLOW PHASE")
     print("=" * 60)
     for phase, use_cases in dashboard.by_workflow_phase().items():
-        blocked_count = sum(1 for uc in use_cases if uc.is_blocked())
-        print(f"\n{phase}: {len(use_cases)} use case(s), {blocked_count} blocked")
-        for uc in use_cases:
-            status = "BLOCKED" if uc.is_blocked() else "CLEAR"
+        blocked = [uc.is_blocked() for uc in use_cases]
+        print(f"\n{phase}: {len(use_cases)} use case(s), {blocked.count(True)} blocked")
+        for uc, is_blocked in zip(use_cases, blocked):
+            status = "BLOCKED" if is_blocked else "CLEAR"
             print(f"  [{status}] {uc.name}")
 
 
@@ -37,6 +37,13 @@ from ai_use_case_context.governance_hooks import (
 )
 
 
+def _emit_flag_raised(use_case, flag):
+    """Emit the FLAG_RAISED governance event for a freshly flagged risk."""
+    emit_governance_event(GovernanceEvent.from_flag(
+        GovernanceEventType.FLAG_RAISED, use_case.name, flag,
+    ))
+
+
 def main():
     clear_hooks()
 
@@ -113,53 +120,25 @@ def main():
         TPN_CONTENT_SECURITY, RiskLevel.HIGH,
         "Dailies footage not encrypted in transit",
     )
-    emit_governance_event(GovernanceEvent(
-        event_type=GovernanceEventType.FLAG_RAISED,
-        use_case_name=uc1.name,
-        dimension=TPN_CONTENT_SECURITY.name,
-        level="HIGH",
-        description=flag1.description,
-        metadata={"reviewer": flag1.reviewer},
-    ))
+    _emit_flag_raised(uc1, flag1)
 
     flag2 = uc1.flag_risk(
         TPN_DIGITAL_SECURITY, RiskLevel.MEDIUM,
         "Review workstations on shared VLAN",
     )
-    emit_governance_event(GovernanceEvent(
-        event_type=GovernanceEventType.FLAG_RAISED,
-        use_case_name=uc1.name,
-        dimension=TPN_DIGITAL_SECURITY.name,
-        level="MEDIUM",
-        description=flag2.description,
-        metadata={"reviewer": flag2.reviewer},
-    ))
+    _emit_flag_raised(uc1, flag2)
 
     flag3 = uc2.flag_risk(
         VFX_CLOUD_SECURITY, RiskLevel.CRITICAL,
         "Cloud render API keys exposed in build config",
     )
-    emit_governance_event(GovernanceEvent(
-        event_type=GovernanceEventType.FLAG_RAISED,
-        use_case_name=uc2.name,
-        dimension=VFX_CLOUD_SECURITY.name,
-        level="CRITICAL",
-        description=flag3.description,
-        metadata={"reviewer": flag3.reviewer},
-    ))
+    _emit_flag_raised(uc2, flag3)
 
     flag4 = uc2.flag_risk(
         VFX_SECURE_TRANSFER, RiskLevel.HIGH,
         "Rendered frames transferred over unencrypted channel",
     )
-    emit_governance_event(GovernanceEvent(
-        event_type=GovernanceEventType.FLAG_RAISED,
-        use_case_name=uc2.name,
-        dimension=VFX_SECURE_TRANSFER.name,
-        level="HIGH",
-        description=flag4.description,
-        metadata={"reviewer": flag4.reviewer},
-    ))
+    _emit_flag_raised(uc2, flag4)
 
     print()
 
@@ -179,35 +158,16 @@ def main():
 
     print("--- Compliance gate evaluation ---\n")
 
-    # Check the CRITICAL cloud security flag
-    check_event = GovernanceEvent(
-        event_type=GovernanceEventType.COMPLIANCE_CHECK,
-        use_case_name=uc2.name,
-        dimension=VFX_CLOUD_SECURITY.name,
-        level="CRITICAL",
-        description="Cloud render API keys exposed",
-        metadata={"reviewer": flag3.reviewer},
-    )
-    passed, failed = gate.evaluate(check_event)
-    print(f"  Compliance check for '{uc2.name}' CRITICAL flag:")
-    print(f"    Passed: {passed}")
-    print(f"    Failed criteria: {failed}")
-    print()
-
-    # Check a flag that should pass
-    ok_event = GovernanceEvent(
-        event_type=GovernanceEventType.COMPLIANCE_CHECK,
-        use_case_name=uc1.name,
-        dimension=TPN_DIGITAL_SECURITY.name,
-        level="MEDIUM",
-        description="Shared VLAN",
-        metadata={"reviewer": flag2.reviewer},
-    )
-    passed, failed = gate.evaluate(ok_event)
-    print(f"  Compliance check for '{uc1.name}' MEDIUM flag:")
-    print(f"    Passed: {passed}")
-    print(f"    Failed criteria: {failed}")
-    print()
+    # The CRITICAL cloud security flag should fail; the MEDIUM one should pass
+    for use_case, flag in ((uc2, flag3), (uc1, flag2)):
+        check_event = GovernanceEvent.from_flag(
+            GovernanceEventType.COMPLIANCE_CHECK, use_case.name, flag,
+        )
+        passed, failed = gate.evaluate(check_event)
+        print(f"  Compliance check for '{use_case.name}' {check_event.level} flag:")
+        print(f"    Passed: {passed}")
+        print(f"    Failed criteria: {failed}")
+        print()
 
     # ------------------------------------------------------------------
     # 7. Query the audit log
@@ -216,14 +176,12 @@ def main():
     print("--- Audit log summary ---\n")
     print(f"  Total events logged: {len(audit.log)}")
 
-    flag_raised = audit.query(event_type=GovernanceEventType.FLAG_RAISED)
-    print(f"  FLAG_RAISED events: {len(flag_raised)}")
-
-    compliance = audit.query(event_type=GovernanceEventType.COMPLIANCE_CHECK)
-    print(f"  COMPLIANCE_CHECK events: {len(compliance)}")
+    by_type = audit.counts("event_type")
+    print(f"  FLAG_RAISED events: {by_type[GovernanceEventType.FLAG_RAISED.value]}")
+    print(f"  COMPLIANCE_CHECK events: {by_type[GovernanceEventType.COMPLIANCE_CHECK.value]}")
 
-    uc2_events = audit.query(use_case_name=uc2.name)
-    print(f"  Events for '{uc2.name}': {len(uc2_events)}")
+    by_use_case = audit.counts("use_case_name")
+    print(f"  Events for '{uc2.name}': {by_use_case[uc2.name]}")
 
     print(f"\n  Notification bridge sent: {bridge.sent_count} alert(s)")
     print()
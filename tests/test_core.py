@@ -1,5 +1,6 @@
 """Tests for the core governance classes."""
 
+import pickle
 import pytest
 from datetime import datetime
 
@@ -80,6 +81,20 @@ class TestRiskFlag:
         assert flag.is_blocking is False
         assert flag.status == ReviewStatus.ACCEPTED
 
+    def test_predicates_follow_direct_assignment(self):
+        flag = RiskFlag(
+            dimension=RiskDimension.SAFETY,
+            level=RiskLevel.LOW,
+            description="test",
+        )
+        assert flag.is_blocking is False
+        flag.level = RiskLevel.HIGH
+        assert flag.is_blocking is True
+        assert flag.needs_review is True
+        flag.status = ReviewStatus.IN_REVIEW
+        assert flag.is_blocking is True
+        assert flag.needs_review is False
+
     def test_needs_review_medium_open(self):
         flag = RiskFlag(
             dimension=RiskDimension.BIAS,
@@ -162,6 +177,16 @@ class TestRiskFlag:
         after = datetime.now()
         assert before <= flag.created_at <= after
 
+    def test_copy_recomputes_state_and_detaches(self):
+        ctx = UseCaseContext("Test")
+        flag = ctx.flag_risk(RiskDimension.BIAS, RiskLevel.HIGH, "test")
+        clone = pickle.loads(pickle.dumps(flag))
+        assert clone == flag
+        assert clone.is_blocking is True
+        clone.resolve()
+        assert flag.is_blocking is True
+        assert ctx.is_blocked() is True
+
 
 # ---------------------------------------------------------------------------
 # UseCaseContext tests
@@ -190,6 +215,16 @@ class TestUseCaseContext:
         ctx = self._make_context(tags=["upscaling", "archival"])
         assert ctx.tags == ["upscaling", "archival"]
 
+    def test_add_tag(self):
+        ctx = self._make_context()
+        ctx.add_tag("upscaling")
+        ctx.add_tag("upscaling")
+        assert ctx.tags == ["upscaling"]
+        other = self._make_context()
+        other.tags.append("archival")
+        assert other.tags == ["archival"]
+        assert ctx.tags == ["upscaling"]
+
     def test_flag_risk_auto_routing(self):
         ctx = self._make_context()
         flag = ctx.flag_risk(
@@ -231,6 +266,56 @@ class TestUseCaseContext:
         )
         assert flag.reviewer == "My Custom Reviewer"
 
+    def test_flag_risk_with_explicit_timestamps(self):
+        ctx = self._make_context()
+        created = datetime(2024, 1, 2, 3, 4, 5)
+        flag = ctx.flag_risk(
+            RiskDimension.SAFETY, RiskLevel.HIGH, "replayed", created_at=created
+        )
+        assert flag.created_at == created
+        resolved = datetime(2024, 1, 3)
+        flag.resolve("done", at=resolved)
+        assert flag.resolved_at == resolved
+
+    def test_flag_risks_batch(self):
+        ctx = self._make_context()
+        ctx.flag_risk(RiskDimension.SAFETY, RiskLevel.LOW, "existing")
+        ctx.risk_score()
+        created = datetime(2024, 5, 1)
+        flags = ctx.flag_risks([
+            (RiskDimension.LEGAL_IP, RiskLevel.HIGH, "routed"),
+            (RiskDimension.BIAS, RiskLevel.MEDIUM, "manual", "Someone"),
+            (RiskDimension.BIAS, RiskLevel.LOW, "replayed", "", created),
+        ])
+        assert ctx.risk_flags[1:] == flags
+        assert flags[0].reviewer == "VP Legal / Business Affairs"
+        assert flags[1].reviewer == "Someone"
+        assert flags[2].reviewer == "Fairness Analyst"
+        assert flags[2].created_at == created
+        assert ctx.is_blocked() is True
+        assert ctx.risk_score()["Bias / Fairness"] == 2
+        flags[0].resolve()
+        assert ctx.is_blocked() is False
+
+    def test_routing_table_edited_in_place(self):
+        custom_table = {
+            (RiskDimension.LEGAL_IP, RiskLevel.HIGH): "Reviewer A",
+        }
+        ctx = self._make_context(routing_table=custom_table)
+        custom_table[(RiskDimension.BIAS, RiskLevel.HIGH)] = "Reviewer B"
+        assert ctx.flag_risk(RiskDimension.BIAS, RiskLevel.HIGH, "x").reviewer == "Reviewer B"
+        custom_table[(RiskDimension.LEGAL_IP, RiskLevel.HIGH)] = "Reviewer C"
+        assert ctx.flag_risk(RiskDimension.LEGAL_IP, RiskLevel.HIGH, "y").reviewer == "Reviewer C"
+        del custom_table[(RiskDimension.BIAS, RiskLevel.HIGH)]
+        assert ctx.flag_risk(RiskDimension.BIAS, RiskLevel.HIGH, "z").reviewer == "Unassigned"
+
+    def test_default_routing_edits_apply_to_all_contexts(self, monkeypatch):
+        existing = self._make_context()
+        key = (RiskDimension.BIAS, RiskLevel.HIGH)
+        monkeypatch.setitem(DEFAULT_ROUTING, key, "New Board")
+        assert existing.flag_risk(*key, "x").reviewer == "New Board"
+        assert self._make_context().flag_risk(*key, "y").reviewer == "New Board"
+
     def test_is_blocked_with_high_flag(self):
         ctx = self._make_context()
         ctx.flag_risk(RiskDimension.LEGAL_IP, RiskLevel.HIGH, "blocker")
@@ -285,6 +370,22 @@ class TestUseCaseContext:
         assert "VP Legal / Business Affairs" in reviewers
         assert "Bias Review Board" in reviewers
 
+    def test_reviewers_needed_in_flag_order(self):
+        ctx = self._make_context()
+        ctx.flag_risk(RiskDimension.SAFETY, RiskLevel.HIGH, "a", reviewer="Zed")
+        ctx.flag_risk(RiskDimension.SAFETY, RiskLevel.LOW, "b", reviewer="Low")
+        ctx.flag_risk(RiskDimension.BIAS, RiskLevel.MEDIUM, "c", reviewer="Amy")
+        ctx.flag_risk(RiskDimension.BIAS, RiskLevel.HIGH, "d", reviewer="Zed")
+        assert ctx.get_reviewers_needed() == ["Zed", "Amy"]
+
+    def test_reviewers_needed_tracks_directly_appended_flags(self):
+        ctx = self._make_context()
+        flag = RiskFlag(RiskDimension.LEGAL_IP, RiskLevel.HIGH, "x", reviewer="Legal")
+        ctx.risk_flags.append(flag)
+        assert ctx.get_reviewers_needed() == ["Legal"]
+        flag.resolve()
+        assert ctx.get_reviewers_needed() == []
+
     def test_risk_score(self):
         ctx = self._make_context()
         ctx.flag_risk(RiskDimension.LEGAL_IP, RiskLevel.HIGH, "high legal")
@@ -305,6 +406,43 @@ class TestUseCaseContext:
         scores = ctx.risk_score()
         assert scores["Legal / IP Ownership"] == 0
 
+    def test_risk_score_tracks_flag_changes(self):
+        ctx = self._make_context()
+        flag = ctx.flag_risk(RiskDimension.LEGAL_IP, RiskLevel.MEDIUM, "issue")
+        assert ctx.risk_score()["Legal / IP Ownership"] == 2
+        flag.level = RiskLevel.CRITICAL
+        assert ctx.risk_score()["Legal / IP Ownership"] == 4
+        assert ctx.max_risk_level() == RiskLevel.CRITICAL
+        flag.accept_risk("ok")
+        assert ctx.risk_score()["Legal / IP Ownership"] == 0
+        assert ctx.max_risk_level() == RiskLevel.NONE
+        ctx.risk_flags.append(
+            RiskFlag(RiskDimension.BIAS, RiskLevel.LOW, "appended directly")
+        )
+        assert ctx.risk_score()["Bias / Fairness"] == 1
+        ctx.risk_flags[-1].dimension = RiskDimension.SAFETY
+        scores = ctx.risk_score()
+        assert scores["Bias / Fairness"] == 0
+        assert scores["Safety / Harmful Output"] == 1
+
+    def test_flag_shared_between_contexts_updates_both(self):
+        a = self._make_context()
+        b = UseCaseContext(name="Other")
+        shared = a.flag_risk(RiskDimension.LEGAL_IP, RiskLevel.HIGH, "shared")
+        assert a.is_blocked() is True
+        b.risk_flags.append(shared)
+        assert b.is_blocked() is True
+        assert b.get_reviewers_needed() == [shared.reviewer]
+        shared.resolve("done")
+        for ctx in (a, b):
+            assert ctx.is_blocked() is False
+            assert ctx.risk_score()["Legal / IP Ownership"] == 0
+            assert ctx.get_reviewers_needed() == []
+        shared.level = RiskLevel.LOW
+        shared.status = ReviewStatus.OPEN
+        assert a.get_flags_by_level(RiskLevel.LOW) == [shared]
+        assert b.get_flags_by_level(RiskLevel.LOW) == [shared]
+
     def test_get_flags_by_dimension(self):
         ctx = self._make_context()
         ctx.flag_risk(RiskDimension.LEGAL_IP, RiskLevel.HIGH, "legal1")
@@ -329,6 +467,24 @@ class TestUseCaseContext:
         high_flags = ctx.get_flags_by_level(RiskLevel.HIGH)
         assert len(high_flags) == 2
 
+    def test_flag_queries_follow_status_changes_in_order(self):
+        ctx = self._make_context()
+        a = ctx.flag_risk(RiskDimension.BIAS, RiskLevel.LOW, "a")
+        b = ctx.flag_risk(RiskDimension.BIAS, RiskLevel.LOW, "b")
+        c = ctx.flag_risk(RiskDimension.BIAS, RiskLevel.LOW, "c")
+        assert ctx.get_flags_by_status(ReviewStatus.OPEN) == [a, b, c]
+        c.resolve()
+        a.resolve()
+        assert ctx.get_flags_by_status(ReviewStatus.RESOLVED) == [a, c]
+        assert ctx.get_flags_by_status(ReviewStatus.OPEN) == [b]
+        b.level = RiskLevel.HIGH
+        assert ctx.get_flags_by_level(RiskLevel.HIGH) == [b]
+        assert ctx.get_blockers() == [b]
+        assert ctx.get_pending_reviews() == [b]
+        b.begin_review()
+        assert ctx.get_blockers() == [b]
+        assert ctx.get_pending_reviews() == []
+
     def test_max_risk_level(self):
         ctx = self._make_context()
         ctx.flag_risk(RiskDimension.LEGAL_IP, RiskLevel.LOW, "low")
@@ -354,6 +510,15 @@ class TestUseCaseContext:
         assert "BLOCKED" in summary
         assert "blocker" in summary
 
+    def test_summary_counts(self):
+        ctx = self._make_context()
+        ctx.flag_risk(RiskDimension.LEGAL_IP, RiskLevel.HIGH, "blocker")
+        ctx.flag_risk(RiskDimension.BIAS, RiskLevel.MEDIUM, "review")
+        ctx.flag_risk(RiskDimension.SAFETY, RiskLevel.CRITICAL, "resolved").resolve()
+        summary = ctx.summary()
+        assert "3 total, 1 blocking, 2 pending review" in summary
+        assert "Bias Review Board" in summary
+
     def test_summary_clear_when_no_blockers(self):
         ctx = self._make_context()
         ctx.flag_risk(RiskDimension.QUALITY, RiskLevel.LOW, "minor")
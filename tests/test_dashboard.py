@@ -7,8 +7,10 @@ from ai_use_case_context.core import (
     RiskLevel,
     ReviewStatus,
     UseCaseContext,
+    Dimension,
 )
 from ai_use_case_context.dashboard import GovernanceDashboard, DimensionSummary
+from ai_use_case_context.serialization import from_dict, to_dict
 
 
 class TestGovernanceDashboard:
@@ -44,6 +46,12 @@ class TestGovernanceDashboard:
         db = self._make_dashboard()
         assert len(db.use_cases) == 3
 
+    def test_register_many(self):
+        db = GovernanceDashboard()
+        ucs = [UseCaseContext(name=n) for n in ("A", "B", "A")]
+        db.register_many(iter(ucs))
+        assert db.use_cases == [ucs[2], ucs[1]]
+
     def test_unregister(self):
         db = self._make_dashboard()
         removed = db.unregister("AI Color Grading")
@@ -51,6 +59,19 @@ class TestGovernanceDashboard:
         assert removed.name == "AI Color Grading"
         assert len(db.use_cases) == 2
 
+    def test_clear(self):
+        db = self._make_dashboard()
+        db.reviewer_workload()
+        db.clear()
+        assert db.use_cases == []
+        assert db.reviewer_workload() == {}
+        assert db.blocked_use_cases() == []
+
+    def test_get_by_name(self):
+        db = self._make_dashboard()
+        assert db.get("AI Upscaling") is db.use_cases[0]
+        assert db.get("missing") is None
+
     def test_unregister_nonexistent(self):
         db = self._make_dashboard()
         assert db.unregister("Nonexistent") is None
@@ -107,6 +128,22 @@ class TestGovernanceDashboard:
         assert len(summaries) == 6
         assert RiskDimension.LEGAL_IP in summaries
 
+    def test_all_dimensions_tracks_new_flags(self):
+        db = self._make_dashboard()
+        assert len(db.all_dimensions()) == 6
+        custom = Dimension("FINANCIAL", "Financial Risk")
+        db.use_cases[1].flag_risk(custom, RiskLevel.LOW, "budget")
+        assert custom in db.all_dimensions()
+        db.unregister("AI Color Grading")
+        assert custom not in db.all_dimensions()
+
+    def test_all_dimension_summaries_match_single(self):
+        db = self._make_dashboard()
+        db.use_cases[0].flag_risk(RiskDimension.SAFETY, RiskLevel.LOW, "minor")
+        for dim, ds in db.all_dimension_summaries().items():
+            assert ds == db.dimension_summary(dim)
+            assert ds.affected == set(ds.affected_use_cases)
+
     def test_reviewer_workload(self):
         db = self._make_dashboard()
         workload = db.reviewer_workload()
@@ -115,6 +152,31 @@ class TestGovernanceDashboard:
         # Bias Review Board should have work
         assert "Bias Review Board" in workload
 
+    def test_reviewer_workload_tracks_changes(self):
+        db = self._make_dashboard()
+        assert "Bias Review Board" in db.reviewer_workload()
+        flag = db.use_cases[0].get_flags_by_dimension(RiskDimension.BIAS)[0]
+        flag.reviewer = "Someone Else"
+        workload = db.reviewer_workload()
+        assert "Bias Review Board" not in workload
+        assert workload["Someone Else"] == [("AI Upscaling", flag)]
+        assert "Someone Else" in db.use_cases[0].get_reviewers_needed()
+        flag.resolve()
+        assert "Someone Else" not in db.reviewer_workload()
+        assert "Someone Else" not in db.use_cases[0].get_reviewers_needed()
+
+    def test_reviewer_workload_tracks_deserialized_flags(self):
+        uc = UseCaseContext(name="Imported")
+        uc.flag_risk(RiskDimension.LEGAL_IP, RiskLevel.HIGH, "rights")
+        uc = from_dict(to_dict(uc))
+        db = GovernanceDashboard()
+        db.register(uc)
+        assert uc.get_reviewers_needed() == ["VP Legal / Business Affairs"]
+        assert "VP Legal / Business Affairs" in db.reviewer_workload()
+        uc.risk_flags[0].resolve()
+        assert uc.get_reviewers_needed() == []
+        assert db.reviewer_workload() == {}
+
     def test_by_workflow_phase(self):
         db = self._make_dashboard()
         phases = db.by_workflow_phase()
@@ -129,6 +191,7 @@ class TestGovernanceDashboard:
         assert "3 use case(s)" in summary
         assert "Blocked" in summary
         assert "Dimension overview" in summary
+        assert "Total flags: 4  |  Blocking: 2  |  Pending review: 3" in summary
 
     def test_repr(self):
         db = self._make_dashboard()
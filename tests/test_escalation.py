@@ -198,3 +198,93 @@ class TestEscalationPolicy:
         result = policy.check_flag(flag, "test_uc", now=check_time)
         assert result is not None
         assert result.age == timedelta(days=4)
+
+    def test_first_matching_rule_wins_and_appends_are_seen(self):
+        first = EscalationRule(
+            from_level=RiskLevel.LOW,
+            threshold=timedelta(hours=1),
+            escalate_to_level=RiskLevel.MEDIUM,
+        )
+        second = EscalationRule(
+            from_level=RiskLevel.LOW,
+            threshold=timedelta(hours=1),
+            escalate_to_level=RiskLevel.CRITICAL,
+        )
+        policy = EscalationPolicy(rules=[first, second])
+        flag = RiskFlag(
+            dimension=RiskDimension.SAFETY,
+            level=RiskLevel.LOW,
+            description="test",
+            created_at=datetime.now() - timedelta(hours=2),
+        )
+        assert policy.check_flag(flag).escalate_to_level == RiskLevel.MEDIUM
+        flag.level = RiskLevel.MEDIUM
+        assert policy.check_flag(flag) is None
+        policy.rules.append(EscalationRule(
+            from_level=RiskLevel.MEDIUM,
+            threshold=timedelta(hours=1),
+            escalate_to_level=RiskLevel.HIGH,
+        ))
+        assert policy.check_flag(flag).escalate_to_level == RiskLevel.HIGH
+
+    def test_rules_replaced_in_place_after_invalidate(self):
+        policy = EscalationPolicy()
+        flag = RiskFlag(
+            dimension=RiskDimension.SAFETY,
+            level=RiskLevel.LOW,
+            description="test",
+            created_at=datetime.now() - timedelta(days=8),
+        )
+        assert policy.check_flag(flag).escalate_to_level == RiskLevel.MEDIUM
+        i = next(i for i, r in enumerate(policy.rules) if r.from_level == RiskLevel.LOW)
+        policy.rules[i] = EscalationRule(
+            from_level=RiskLevel.LOW,
+            threshold=timedelta(days=30),
+            escalate_to_level=RiskLevel.HIGH,
+        )
+        policy.invalidate()
+        assert policy.check_flag(flag) is None
+        # Other rule fields are read live from the rule object.
+        policy.rules[i].threshold = timedelta(days=1)
+        assert policy.check_flag(flag).escalate_to_level == RiskLevel.HIGH
+        policy.rules[i].from_level = RiskLevel.MEDIUM
+        policy.invalidate()
+        assert policy.check_flag(flag) is None
+        policy.rules = list(EscalationPolicy.DEFAULT_RULES)
+        assert policy.check_flag(flag).escalate_to_level == RiskLevel.MEDIUM
+
+    def test_threshold_boundary(self):
+        """A flag exactly at its threshold age escalates; one second younger does not."""
+        policy = EscalationPolicy()
+        now = datetime(2025, 1, 4)
+        uc = UseCaseContext("Boundary")
+        at_threshold = uc.flag_risk(
+            RiskDimension.BIAS, RiskLevel.MEDIUM, "due",
+            created_at=now - timedelta(days=3),
+        )
+        uc.flag_risk(
+            RiskDimension.BIAS, RiskLevel.MEDIUM, "not yet",
+            created_at=now - timedelta(days=3) + timedelta(seconds=1),
+        )
+        results = policy.check_use_case(uc, now=now)
+        assert [r.flag for r in results] == [at_threshold]
+        assert results[0].age == timedelta(days=3)
+        assert policy.check_flag(at_threshold, now=now) is not None
+
+    def test_check_dashboard_shares_one_now(self):
+        from ai_use_case_context.dashboard import GovernanceDashboard
+
+        policy = EscalationPolicy()
+        now = datetime(2025, 1, 10)
+        dash = GovernanceDashboard()
+        for name in ("A", "B"):
+            uc = UseCaseContext(name)
+            uc.flag_risk(
+                RiskDimension.BIAS, RiskLevel.LOW, "old",
+                created_at=now - timedelta(days=8),
+            )
+            uc.flag_risk(RiskDimension.BIAS, RiskLevel.LOW, "fresh", created_at=now)
+            dash.register(uc)
+        results = policy.check_dashboard(dash, now=now)
+        assert [r.use_case_name for r in results] == ["A", "B"]
+        assert all(r.age == timedelta(days=8) for r in results)
@@ -3,19 +3,28 @@
 import pytest
 from datetime import datetime, timedelta
 
+from ai_use_case_context import governance_hooks
 from ai_use_case_context.governance_hooks import (
     GovernanceEventType,
     GovernanceEvent,
     GovernanceHook,
+    DispatchMode,
     register_hook,
     unregister_hook,
     clear_hooks,
     registered_hooks,
     emit_governance_event,
+    flush_async_hooks,
     AuditLogger,
     ComplianceGate,
     NotificationBridge,
 )
+from ai_use_case_context.core import (
+    RiskDimension,
+    RiskLevel,
+    ReviewStatus,
+    UseCaseContext,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -26,6 +35,16 @@ def _clean_hooks():
     clear_hooks()
 
 
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    """Run a test with orjson (when installed) and with the stdlib encoder."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(governance_hooks, "orjson", None)
+    return request.param
+
+
 # ---------------------------------------------------------------------------
 # GovernanceEvent tests
 # ---------------------------------------------------------------------------
@@ -65,6 +84,80 @@ class TestGovernanceEvent:
         assert event.actor == "system"
         assert event.metadata == {}
 
+    def test_to_dict_reflects_changes_and_returns_copies(self):
+        event = GovernanceEvent(
+            event_type=GovernanceEventType.CUSTOM, metadata={"k": 1},
+        )
+        first = event.to_dict()
+        first["description"] = "edited"
+        first["metadata"]["k"] = 2
+        assert event.to_dict()["description"] == ""
+        assert event.metadata == {"k": 1}
+        event.description = "changed"
+        event.metadata["k"] = 3
+        assert event.to_dict()["description"] == "changed"
+        assert event.to_dict()["metadata"] == {"k": 3}
+
+    def test_from_flag(self):
+        uc = UseCaseContext(name="UC")
+        flag = uc.flag_risk(RiskDimension.SECURITY, RiskLevel.HIGH, "Keys in repo")
+        event = GovernanceEvent.from_flag(
+            GovernanceEventType.FLAG_RAISED, uc.name, flag,
+            actor="web", metadata={"ticket": "SEC-1"},
+        )
+        assert event.use_case_name == "UC"
+        assert event.dimension == "SECURITY"
+        assert event.level == "HIGH"
+        assert event.description == "Keys in repo"
+        assert event.actor == "web"
+        assert event.metadata == {"reviewer": flag.reviewer, "ticket": "SEC-1"}
+
+    def test_to_json_bytes(self):
+        import json
+
+        event = GovernanceEvent(event_type=GovernanceEventType.CUSTOM, level="HIGH")
+        encoded = event.to_json_bytes()
+        assert json.loads(encoded) == event.to_dict()
+        event.level = "LOW"
+        assert json.loads(event.to_json_bytes())["level"] == "LOW"
+        assert event.to_json_bytes() is event.to_json_bytes()
+        event.metadata["k"] = 2
+        assert json.loads(event.to_json_bytes()) == event.to_dict()
+        assert json.loads(event.to_json_bytes())["metadata"] == {"k": 2}
+
+    def test_to_json_bytes_same_for_both_backends(self, json_backend):
+        event = GovernanceEvent(
+            event_type=GovernanceEventType.CUSTOM,
+            description="Café",
+            timestamp=datetime(2024, 1, 1, 9, 30),
+            metadata={
+                "status": ReviewStatus.OPEN,
+                "due": datetime(2024, 1, 1),
+                "owner": "é",
+                "ref": RiskDimension.BIAS,
+            },
+        )
+        assert event.to_json_bytes() == (
+            '{"event_type":"custom","use_case_name":"","dimension":"",'
+            '"level":"","description":"Café","actor":"system",'
+            '"timestamp":"2024-01-01T09:30:00",'
+            '"metadata":{"status":"Open","due":"2024-01-01T00:00:00",'
+            '"owner":"é","ref":"Bias / Fairness"}}'
+        ).encode()
+
+    def test_caches_are_not_dataclass_fields(self):
+        import dataclasses
+
+        event = GovernanceEvent(event_type=GovernanceEventType.CUSTOM)
+        event.to_json_bytes()
+        names = [f.name for f in dataclasses.fields(event)]
+        assert names == [
+            "event_type", "use_case_name", "dimension", "level",
+            "description", "actor", "timestamp", "metadata",
+        ]
+        assert set(dataclasses.asdict(event)) == set(names)
+        assert event == dataclasses.replace(event)
+
     def test_all_event_types(self):
         # Verify all enum members exist
         assert len(GovernanceEventType) == 11
@@ -99,6 +192,38 @@ class TestHookRegistry:
         hook = GovernanceHook()
         assert unregister_hook(hook) is False
 
+    def test_unhashable_hooks_by_identity(self):
+        class Unhashable(GovernanceHook):
+            __hash__ = None
+
+            def __eq__(self, other):
+                return isinstance(other, Unhashable)
+
+        a, b = Unhashable(), Unhashable()
+        register_hook(a)
+        register_hook(b)
+        register_hook(a)
+        assert len(registered_hooks()) == 2
+        assert unregister_hook(b) is True
+        assert registered_hooks()[0] is a
+        assert unregister_hook(b) is False
+
+    def test_concurrent_registration(self):
+        import threading
+
+        hooks = [GovernanceHook() for _ in range(200)]
+
+        def register_all():
+            for hook in hooks:
+                register_hook(hook)
+
+        threads = [threading.Thread(target=register_all) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(registered_hooks()) == 200
+
     def test_clear_hooks(self):
         register_hook(GovernanceHook())
         register_hook(GovernanceHook())
@@ -227,6 +352,102 @@ class TestEventDispatch:
         assert counts["a"] == 1
         assert counts["b"] == 1
 
+    def test_unregister_during_dispatch(self):
+        calls = []
+
+        class SelfRemoving(GovernanceHook):
+            def on_event(self, event):
+                calls.append("first")
+                unregister_hook(self)
+
+        class Second(GovernanceHook):
+            def on_event(self, event):
+                calls.append("second")
+
+        register_hook(SelfRemoving())
+        register_hook(Second())
+        emit_governance_event(GovernanceEvent(event_type=GovernanceEventType.CUSTOM))
+        emit_governance_event(GovernanceEvent(event_type=GovernanceEventType.CUSTOM))
+        assert calls == ["first", "second", "second"]
+
+    def test_fire_and_forget_delivers_in_order(self):
+        import threading
+
+        seen = []
+        threads = set()
+
+        class Slow(GovernanceHook):
+            def on_flag_raised(self, event):
+                seen.append(("raised", event.description))
+
+            def on_event(self, event):
+                threads.add(threading.get_ident())
+                if event.description == "boom":
+                    raise RuntimeError("hook failed")
+                seen.append(("any", event.description))
+
+        register_hook(Slow(), mode=DispatchMode.FIRE_AND_FORGET)
+        for desc in ("a", "boom", "b"):
+            emit_governance_event(GovernanceEvent(
+                event_type=GovernanceEventType.FLAG_RAISED, description=desc,
+            ))
+        errors = flush_async_hooks()
+        assert seen == [
+            ("raised", "a"), ("any", "a"), ("raised", "boom"),
+            ("raised", "b"), ("any", "b"),
+        ]
+        assert [str(e) for e in errors] == ["hook failed"]
+        assert threading.get_ident() not in threads
+        assert flush_async_hooks() == []
+
+    def test_thread_pool_mode(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        logger = AuditLogger()
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            register_hook(logger, mode=DispatchMode.THREAD_POOL, executor=pool)
+            for _ in range(5):
+                emit_governance_event(GovernanceEvent(
+                    event_type=GovernanceEventType.CUSTOM,
+                ))
+            assert flush_async_hooks() == []
+        assert len(logger.log) == 5
+
+    def test_uninterested_hooks_are_skipped(self):
+        from ai_use_case_context import governance_hooks
+
+        escalations = []
+
+        class EscalationOnly(GovernanceHook):
+            def on_flag_escalated(self, event):
+                escalations.append(event)
+
+        register_hook(EscalationOnly())
+        register_hook(GovernanceHook())
+        buckets = governance_hooks._dispatch_by_type
+        assert buckets[GovernanceEventType.FLAG_RAISED] == ()
+        assert len(buckets[GovernanceEventType.FLAG_ESCALATED]) == 1
+        emit_governance_event(GovernanceEvent(event_type=GovernanceEventType.FLAG_RAISED))
+        emit_governance_event(GovernanceEvent(event_type=GovernanceEventType.FLAG_ESCALATED))
+        assert len(escalations) == 1
+
+    def test_inherited_and_instance_handlers(self):
+        calls = []
+
+        class Base(GovernanceHook):
+            def on_flag_raised(self, event):
+                calls.append("raised")
+
+        class Child(Base):
+            pass
+
+        hook = Child()
+        hook.on_event = lambda event: calls.append("instance")
+        register_hook(hook)
+        emit_governance_event(GovernanceEvent(event_type=GovernanceEventType.FLAG_RAISED))
+        emit_governance_event(GovernanceEvent(event_type=GovernanceEventType.CUSTOM))
+        assert calls == ["raised", "instance", "instance"]
+
 
 # ---------------------------------------------------------------------------
 # AuditLogger tests
@@ -262,6 +483,59 @@ class TestAuditLogger:
         assert len(external) == 1
         assert external[0]["event_type"] == "flag_raised"
 
+    def test_auditable_file_sink(self, tmp_path):
+        import json
+
+        path = tmp_path / "audit.jsonl"
+        with open(path, "a") as fh:
+            logger = AuditLogger(sink=fh, auditable=True)
+            register_hook(logger)
+            emit_governance_event(GovernanceEvent(
+                event_type=GovernanceEventType.FLAG_RAISED, description="x",
+            ))
+            # Durable before the handle is closed.
+            lines = path.read_text().splitlines()
+        assert [json.loads(line) for line in lines] == logger.log
+
+    def test_auditable_rejects_async(self):
+        with pytest.raises(ValueError):
+            AuditLogger(sink=print, auditable=True, async_sink=True)
+
+    def test_async_batch_sink(self):
+        batches = []
+        logger = AuditLogger(
+            batch_sink=batches.append, async_sink=True,
+            batch_size=2, flush_interval=5,
+        )
+        register_hook(logger)
+        for _ in range(3):
+            emit_governance_event(GovernanceEvent(
+                event_type=GovernanceEventType.FLAG_RAISED,
+            ))
+        assert len(logger.log) == 3
+        logger.close()
+        assert [len(b) for b in batches] == [2, 1]
+        assert [e for b in batches for e in b] == logger.log
+
+    def test_async_sink_flush_and_errors(self):
+        external = []
+
+        def sink(entry):
+            if entry["description"] == "bad":
+                raise RuntimeError("sink down")
+            external.append(entry)
+
+        logger = AuditLogger(sink=sink, async_sink=True, flush_interval=0)
+        register_hook(logger)
+        for desc in ("a", "bad", "b"):
+            emit_governance_event(GovernanceEvent(
+                event_type=GovernanceEventType.CUSTOM, description=desc,
+            ))
+            logger.flush()
+        assert [e["description"] for e in external] == ["a", "b"]
+        assert len(logger.sink_errors) == 1
+        logger.close()
+
     def test_query_by_event_type(self):
         logger = AuditLogger()
         register_hook(logger)
@@ -299,6 +573,33 @@ class TestAuditLogger:
         results = logger.query(since=future)
         assert len(results) == 0
 
+    def test_query_combined_filters_match_scan(self):
+        logger = AuditLogger()
+        register_hook(logger)
+        base = datetime(2025, 1, 1)
+        types = [GovernanceEventType.FLAG_RAISED, GovernanceEventType.FLAG_RESOLVED]
+        # Out-of-order timestamps exercise the non-bisect path.
+        for i, hours in enumerate([0, 1, 2, 5, 3, 4]):
+            emit_governance_event(GovernanceEvent(
+                event_type=types[i % 2],
+                use_case_name=f"UC{i % 3}",
+                timestamp=base + timedelta(hours=hours),
+            ))
+        logger.log.append(dict(logger.log[0], use_case_name="UC9"))
+
+        since = base + timedelta(hours=2)
+        for etype in (None, *types):
+            for name in (None, "UC0", "UC1", "UC9", "missing"):
+                for cutoff in (None, since):
+                    expected = [
+                        e for e in logger.log
+                        if (etype is None or e["event_type"] == etype.value)
+                        and (name is None or e["use_case_name"] == name)
+                        and (cutoff is None or e["timestamp"] >= cutoff.isoformat())
+                    ]
+                    got = logger.query(event_type=etype, use_case_name=name, since=cutoff)
+                    assert got == expected
+
     def test_query_no_filters(self):
         logger = AuditLogger()
         register_hook(logger)
@@ -306,6 +607,25 @@ class TestAuditLogger:
         emit_governance_event(GovernanceEvent(event_type=GovernanceEventType.FLAG_RAISED))
         assert len(logger.query()) == 1
 
+    def test_counts(self):
+        logger = AuditLogger()
+        register_hook(logger)
+        for etype, name, level in [
+            (GovernanceEventType.FLAG_RAISED, "UC1", "HIGH"),
+            (GovernanceEventType.FLAG_RAISED, "UC2", "LOW"),
+            (GovernanceEventType.FLAG_RESOLVED, "UC1", "HIGH"),
+        ]:
+            emit_governance_event(GovernanceEvent(
+                event_type=etype, use_case_name=name, level=level,
+            ))
+        assert logger.counts() == {"flag_raised": 2, "flag_resolved": 1}
+        assert logger.counts("use_case_name") == {"UC1": 2, "UC2": 1}
+        assert logger.counts("level") == {"HIGH": 2, "LOW": 1}
+        assert logger.counts()["custom"] == 0
+
+        logger.log.append(dict(logger.log[0]))
+        assert logger.counts()["flag_raised"] == 3
+
 
 # ---------------------------------------------------------------------------
 # ComplianceGate tests
@@ -388,6 +708,58 @@ class TestComplianceGate:
         assert len(gate.results_log) == 1
         assert gate.results_log[0]["passed"] is True
 
+    def test_fail_fast_stops_at_first_failure(self):
+        calls = []
+        gate = ComplianceGate()
+        for name, ok in (("a", True), ("b", False), ("c", False)):
+            gate.add_criterion(name, lambda e, name=name, ok=ok: calls.append(name) or ok)
+        assert gate.evaluate(GovernanceEvent(event_type=GovernanceEventType.CUSTOM),
+                             fail_fast=True) == (False, ["b"])
+        assert calls == ["a", "b"]
+        assert gate.evaluate(GovernanceEvent(event_type=GovernanceEventType.CUSTOM)) == (
+            False, ["b", "c"],
+        )
+        gate.remove_criterion("b")
+        gate.remove_criterion("c")
+        assert gate.evaluate(GovernanceEvent(event_type=GovernanceEventType.CUSTOM)) == (True, [])
+
+    def test_results_log_disabled(self):
+        gate = ComplianceGate(keep_results_log=False)
+        gate.add_criterion("check", lambda e: True)
+        gate.evaluate(GovernanceEvent(event_type=GovernanceEventType.COMPLIANCE_CHECK))
+        assert gate.results_log == []
+
+    def test_result_event_opt_out(self):
+        gate = ComplianceGate(emit_result_event=False)
+        gate.add_criterion("check", lambda e: True)
+        logger = AuditLogger()
+        register_hook(logger)
+        gate.evaluate(GovernanceEvent(event_type=GovernanceEventType.COMPLIANCE_CHECK))
+        assert logger.log == []
+        assert len(gate.results_log) == 1
+
+    def test_gates_reacting_to_results_do_not_recurse(self):
+        gate_a = ComplianceGate()
+        gate_b = ComplianceGate()
+        gate_a.add_criterion("ok", lambda e: True)
+        gate_b.add_criterion("ok", lambda e: True)
+
+        class Chain(GovernanceHook):
+            def on_compliance_check(self, event):
+                if event.actor == "compliance_gate":
+                    gate_a.evaluate(event)
+                    gate_b.evaluate(event)
+
+        logger = AuditLogger()
+        register_hook(Chain())
+        register_hook(logger)
+        gate_a.evaluate(GovernanceEvent(event_type=GovernanceEventType.COMPLIANCE_CHECK))
+        # Each gate still evaluates every result it is handed, but only
+        # emits one result event of its own per top-level call.
+        assert len(gate_a.results_log) == 3
+        assert len(gate_b.results_log) == 2
+        assert [e["event_type"] for e in logger.log] == ["compliance_gate_passed"] * 2
+
     def test_gate_emits_sub_events(self):
         gate = ComplianceGate()
         gate.add_criterion("check", lambda e: True)
@@ -443,6 +815,18 @@ class TestNotificationBridge:
         assert received[0]["description"] == "Test"
         assert bridge.sent_count == 1
 
+    def test_encoded_callback(self):
+        import json
+
+        received = []
+        register_hook(NotificationBridge(callback=received.append, encoded=True))
+        register_hook(NotificationBridge(callback=received.append, encoded=True))
+        emit_governance_event(GovernanceEvent(
+            event_type=GovernanceEventType.FLAG_RAISED, description="Test",
+        ))
+        assert received[0] is received[1]
+        assert json.loads(received[0])["description"] == "Test"
+
     def test_filter_blocks_events(self):
         received = []
         bridge = NotificationBridge(
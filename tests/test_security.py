@@ -7,6 +7,7 @@ from ai_use_case_context.core import (
     RiskLevel,
     UseCaseContext,
     DEFAULT_ROUTING,
+    custom_dimension,
 )
 from ai_use_case_context.security import (
     # TPN
@@ -179,6 +180,20 @@ class TestSecurityProfile:
         merged = p1.merge(p1)
         assert len(merged.dimensions) == 6  # No duplicates
 
+    def test_profile_merge_precedence(self):
+        renamed = custom_dimension("TPN_CONTENT_SECURITY", "Renamed")
+        override = {(TPN_CONTENT_SECURITY, RiskLevel.HIGH): "Override Team"}
+        p1 = SecurityProfile(list(TPN_DIMENSIONS), dict(TPN_ROUTING), ["tpn"])
+        p2 = SecurityProfile([renamed], override, ["custom", "tpn"])
+        merged = p1.merge(p2)
+        # First dimension with a given name wins; later routing wins.
+        assert merged.dimensions == list(TPN_DIMENSIONS)
+        assert merged.dimensions[0] is TPN_CONTENT_SECURITY
+        assert merged.routing[(TPN_CONTENT_SECURITY, RiskLevel.HIGH)] == "Override Team"
+        assert merged.presets == ["tpn", "custom"]
+        # Inputs are left untouched.
+        assert p1.routing == TPN_ROUTING
+
     def test_profile_repr(self):
         profile = SecurityProfile(list(TPN_DIMENSIONS), {}, ["tpn"])
         assert "dimensions=6" in repr(profile)
@@ -208,6 +223,12 @@ class TestSecurityProfileFactory:
         profile = security_profile("TPN")
         assert len(profile.dimensions) == 6
 
+    def test_profile_routing_is_independent_of_presets(self):
+        profile = security_profile("tpn")
+        profile.routing[(TPN_CONTENT_SECURITY, RiskLevel.LOW)] = "Someone Else"
+        assert TPN_ROUTING[(TPN_CONTENT_SECURITY, RiskLevel.LOW)] != "Someone Else"
+        assert security_profile("tpn").routing == TPN_ROUTING
+
     def test_combined_routing(self):
         profile = security_profile("tpn", "vfx")
         # All TPN + VFX routing entries should be present
@@ -247,6 +268,59 @@ class TestApplySecurityProfile:
         assert f2.reviewer == "Compliance Officer"
 
 
+    def test_apply_overrides_existing_and_manual_profiles(self):
+        ctx = UseCaseContext("Test")
+        apply_security_profile(ctx, security_profile("tpn"))
+        override = SecurityProfile(routing={
+            (RiskDimension.BIAS, RiskLevel.HIGH): "Bias Lead",
+            (TPN_CONTENT_SECURITY, RiskLevel.LOW): "Content Desk",
+        })
+        apply_security_profile(ctx, override)
+        assert ctx.flag_risk(RiskDimension.BIAS, RiskLevel.HIGH, "x").reviewer == "Bias Lead"
+        assert ctx.flag_risk(RiskDimension.BIAS, RiskLevel.LOW, "x").reviewer == (
+            DEFAULT_ROUTING[(RiskDimension.BIAS, RiskLevel.LOW)]
+        )
+        assert ctx.flag_risk(TPN_CONTENT_SECURITY, RiskLevel.LOW, "x").reviewer == "Content Desk"
+        assert ctx.flag_risk(TPN_CONTENT_SECURITY, RiskLevel.HIGH, "x").reviewer == (
+            TPN_ROUTING[(TPN_CONTENT_SECURITY, RiskLevel.HIGH)]
+        )
+        # Shared tables are untouched.
+        assert DEFAULT_ROUTING[(RiskDimension.BIAS, RiskLevel.HIGH)] != "Bias Lead"
+        assert UseCaseContext("Fresh").flag_risk(
+            RiskDimension.BIAS, RiskLevel.HIGH, "x"
+        ).reviewer != "Bias Lead"
+
+    def test_apply_shares_default_routing(self):
+        ctx = UseCaseContext("Test")
+        apply_security_profile(ctx, security_profile("tpn"))
+        apply_security_profile(ctx, security_profile("vfx"))
+        assert ctx.routing_table.maps[-1] is DEFAULT_ROUTING
+        flat = ctx.flatten_routing()
+        assert type(flat) is dict
+        assert flat == {**DEFAULT_ROUTING, **TPN_ROUTING, **VFX_ROUTING}
+        # In-place edits land in the context's own layer.
+        ctx.routing_table[(RiskDimension.SAFETY, RiskLevel.LOW)] = "Safety Desk"
+        assert ctx.flag_risk(RiskDimension.SAFETY, RiskLevel.LOW, "x").reviewer == "Safety Desk"
+        assert DEFAULT_ROUTING[(RiskDimension.SAFETY, RiskLevel.LOW)] != "Safety Desk"
+
+    def test_reapplying_does_not_stack_layers(self):
+        ctx = UseCaseContext("Test")
+        profile = security_profile("tpn")
+        for _ in range(50):
+            apply_security_profile(ctx, profile)
+        apply_security_profile(ctx, security_profile("vfx"))
+        assert len(ctx.routing_table.maps) == 2
+        assert ctx.routing_table.maps[-1] is DEFAULT_ROUTING
+        assert ctx.flatten_routing() == {**DEFAULT_ROUTING, **TPN_ROUTING, **VFX_ROUTING}
+
+    def test_profile_routing_added_after_creation(self):
+        profile = security_profile("vfx")
+        profile.routing[(RiskDimension.SAFETY, RiskLevel.LOW)] = "Late Addition"
+        ctx = UseCaseContext("Test")
+        apply_security_profile(ctx, profile)
+        assert ctx.flag_risk(RiskDimension.SAFETY, RiskLevel.LOW, "x").reviewer == "Late Addition"
+
+
 # ---------------------------------------------------------------------------
 # Preset registry tests
 # ---------------------------------------------------------------------------
@@ -10,11 +10,18 @@ from ai_use_case_context.core import (
     ReviewStatus,
     UseCaseContext,
 )
+from ai_use_case_context import serialization
 from ai_use_case_context.serialization import (
     to_dict,
     from_dict,
+    from_dict_many,
     to_json,
+    to_json_bytes,
     from_json,
+    dump,
+    iter_chunks,
+    to_msgpack,
+    from_msgpack,
 )
 
 
@@ -123,3 +130,112 @@ class TestSerialization:
         assert restored.name == "Empty"
         assert restored.risk_flags == []
         assert restored.is_blocked() is False
+
+    def test_json_custom_indent(self):
+        ctx = self._make_context()
+        assert json.loads(to_json(ctx, indent=4)) == json.loads(to_json(ctx))
+        assert json.loads(to_json(ctx, indent=None)) == to_dict(ctx)
+
+    def test_msgpack_round_trip(self):
+        pytest.importorskip("msgpack")
+        ctx = self._make_context()
+        restored = from_msgpack(to_msgpack(ctx))
+        assert to_dict(restored) == to_dict(ctx)
+
+    def test_timestamp_wire_format(self):
+        ctx = UseCaseContext("Stamps", created_at=datetime(2025, 3, 1, 9, 30))
+        ctx.flag_risk(
+            RiskDimension.BIAS, RiskLevel.LOW, "x",
+            created_at=datetime(2025, 3, 1, 10, 0, 0, 123),
+        )
+        d = to_dict(ctx)
+        assert d["created_at"] == "2025-03-01T09:30:00.000000"
+        assert d["risk_flags"][0]["created_at"] == "2025-03-01T10:00:00.000123"
+        restored = from_dict(d)
+        assert restored.created_at == ctx.created_at
+        assert restored.risk_flags[0].created_at == ctx.risk_flags[0].created_at
+
+    def test_timezone_aware_timestamp_rejected(self):
+        d = to_dict(UseCaseContext("Aware"))
+        d["created_at"] = "2025-03-01T09:30:00.000000+00:00"
+        with pytest.raises(ValueError):
+            from_dict(d)
+        d = to_dict(self._make_context())
+        d["risk_flags"][0]["created_at"] = "2025-03-01T09:30:00.000000+02:00"
+        with pytest.raises(ValueError):
+            from_dict(d)
+
+    def test_json_bytes_round_trip(self):
+        ctx = self._make_context()
+        data = to_json_bytes(ctx)
+        assert isinstance(data, bytes)
+        assert json.loads(data) == to_dict(ctx)
+        assert json.loads(to_json_bytes(ctx, indent=4)) == to_dict(ctx)
+        assert to_dict(from_json(data)) == to_dict(ctx)
+
+    def test_from_dict_many(self):
+        ctx = self._make_context()
+        other = UseCaseContext("Other")
+        restored = from_dict_many([to_dict(ctx), to_dict(other)])
+        assert [to_dict(r) for r in restored] == [to_dict(ctx), to_dict(other)]
+        assert restored[0].is_blocked() is ctx.is_blocked()
+        assert from_dict_many([]) == []
+
+    def test_iter_chunks(self):
+        for ctx in (self._make_context(), UseCaseContext("Empty")):
+            chunks = list(iter_chunks(ctx))
+            assert len(chunks) == len(ctx.risk_flags) + 2
+            assert json.loads(b"".join(chunks)) == to_dict(ctx)
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    """Run a test with orjson (when installed) and with the stdlib encoder."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(serialization, "orjson", None)
+    return request.param
+
+
+class TestJsonBackends:
+    def _make_context(self) -> UseCaseContext:
+        ctx = UseCaseContext(
+            name="Café — Hero Shots",
+            description="Non-ASCII “quoted” text",
+            tags=["ünïcode"],
+        )
+        ctx.flag_risk(RiskDimension.LEGAL_IP, RiskLevel.HIGH, "Likeness — rights")
+        ctx.flag_risk(RiskDimension.BIAS, RiskLevel.LOW, "ascii only").resolve("ok")
+        return ctx
+
+    def test_to_json_matches_stdlib(self, json_backend):
+        for ctx in (self._make_context(), UseCaseContext("Plain")):
+            data = to_dict(ctx)
+            for indent in (2, None, 4):
+                assert to_json(ctx, indent=indent) == json.dumps(data, indent=indent)
+
+    def test_to_json_bytes_is_raw_utf8(self, json_backend):
+        ctx = self._make_context()
+        data = to_dict(ctx)
+        assert to_json_bytes(ctx) == json.dumps(
+            data, separators=(",", ":"), ensure_ascii=False,
+        ).encode()
+        assert to_json_bytes(ctx, indent=2) == json.dumps(
+            data, indent=2, ensure_ascii=False,
+        ).encode()
+        assert to_dict(from_json(to_json_bytes(ctx))) == data
+        assert to_dict(from_json(to_json(ctx))) == data
+
+    def test_dump_matches_to_json(self, json_backend):
+        import io
+
+        for ctx in (self._make_context(), UseCaseContext("Plain")):
+            for indent in (2, None):
+                buf = io.StringIO()
+                dump(ctx, buf, indent=indent)
+                assert buf.getvalue() == to_json(ctx, indent=indent)
+
+    def test_iter_chunks_matches_to_json_bytes(self, json_backend):
+        for ctx in (self._make_context(), UseCaseContext("Empty")):
+            assert b"".join(iter_chunks(ctx)) == to_json_bytes(ctx)
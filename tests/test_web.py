@@ -58,6 +58,84 @@ class TestPageLoading:
         assert r.status_code == 200
         assert b"not found" in r.data.lower()
 
+    def test_layout_marks_active_nav_link(self, client):
+        r = client.get("/reviewers")
+        assert b'<a href="/reviewers" class="active">Reviewers</a>' in r.data
+        assert b'<a href="/scores" class="">Score Reports</a>' in r.data
+
+    def test_stylesheet_linked_not_inlined(self, client):
+        r = client.get("/")
+        assert b'<link rel="stylesheet" href="/_static/app.css">' in r.data
+        assert b"<style>" not in r.data
+
+    def test_stylesheet_is_cacheable(self, client):
+        r = client.get("/_static/app.css")
+        assert r.status_code == 200
+        assert r.mimetype == "text/css"
+        assert b".heatmap" in r.data
+        assert "immutable" in r.headers["Cache-Control"]
+        etag = r.headers["ETag"]
+        r2 = client.get("/_static/app.css", headers={"If-None-Match": etag})
+        assert r2.status_code == 304
+
+    def test_heavy_pages_are_streamed(self, client):
+        client.post("/seed")
+        for path in ("/", "/scores", "/reviewers", "/use-case/AI Script Analysis"):
+            r = client.get(path)
+            assert r.is_streamed
+            assert r.status_code == 200
+            assert r.data.endswith(b"</body></html>")
+
+    def test_create_app_is_memoized(self):
+        from ai_use_case_context.web import _create_app_uncached
+        assert create_app() is create_app()
+        assert _create_app_uncached() is not create_app()
+
+    def test_main_parses_port(self, monkeypatch):
+        from ai_use_case_context.web import main
+        calls = []
+        monkeypatch.setattr(create_app(), "run", lambda **kw: calls.append(kw))
+        main(["--port", "8123"])
+        main(["-p", "8124"])
+        main([])
+        assert [c["port"] for c in calls] == [8123, 8124, 5000]
+        with pytest.raises(SystemExit):
+            main(["--port"])
+
+    def test_main_prod_uses_waitress(self, monkeypatch):
+        import sys
+        import types
+        from ai_use_case_context.web import main
+        calls = []
+        waitress = types.ModuleType("waitress")
+        waitress.serve = lambda app, **kw: calls.append((app, kw["port"]))
+        monkeypatch.setitem(sys.modules, "waitress", waitress)
+        main(["--prod", "-p", "8125"])
+        assert calls == [(create_app(), 8125)]
+        monkeypatch.setitem(sys.modules, "waitress", None)
+        with pytest.raises(SystemExit):
+            main(["--prod"])
+
+    def test_layout_template_compiled_once(self, client):
+        from ai_use_case_context.web import _tpl
+        client.get("/")
+        client.get("/scores")
+        assert _tpl("layout") is _tpl("layout")
+        assert _tpl.cache_info().misses <= 1
+
+    def test_title_cannot_collide_with_body_slot(self, client):
+        _dashboard.register(UseCaseContext(name="<!--body-->"))
+        r = client.get("/use-case/<!--body-->")
+        html = r.get_data(as_text=True)
+        assert "<title>&lt;!--body--&gt; — AI Governance</title>" in html
+        assert html.count("</html>") == 1
+        assert "Risk Score Breakdown" in html
+
+    def test_layout_escapes_title(self, client):
+        _dashboard.register(UseCaseContext(name="R&D <draft>"))
+        r = client.get("/use-case/R&D <draft>")
+        assert "<title>R&amp;D &lt;draft&gt; — AI Governance</title>" in r.get_data(as_text=True)
+
 
 # -- Seed demo data --------------------------------------------------------
 
@@ -120,6 +198,12 @@ class TestAddUseCase:
         assert uc.workflow_phase == "Pre-Production"
         assert uc.tags == ["tag1", "tag2"]
 
+    def test_create_use_case_skips_blank_tags(self, client):
+        client.post("/add-use-case", data={"name": "Tagged", "tags": " a, ,b ,,"})
+        assert _dashboard.get("Tagged").tags == ["a", "b"]
+        client.post("/add-use-case", data={"name": "Untagged", "tags": "  "})
+        assert _dashboard.get("Untagged").tags == []
+
     def test_create_empty_name_ignored(self, client):
         r = client.post("/add-use-case", data={"name": "", "description": ""})
         # Should not redirect to a use case page
@@ -141,6 +225,62 @@ class TestUseCaseDetail:
         assert b"BLOCKED" in r.data
         assert b"Blocking issue" in r.data
 
+    def test_badges_are_prerendered(self):
+        from ai_use_case_context.web import (
+            _badge, _level_badge, _status_badge, _LEVEL_COLORS,
+        )
+        for level in RiskLevel:
+            assert _level_badge(level) == _badge(level.name, *_LEVEL_COLORS[level])
+        for status in ReviewStatus:
+            assert status.value in _status_badge(status)
+
+    def test_portfolio_snapshot_reused_within_request(self):
+        from ai_use_case_context.web import _portfolio_snapshot
+        app = create_app()
+        with app.test_request_context("/"):
+            assert _portfolio_snapshot() is _portfolio_snapshot()
+        with app.test_request_context("/"):
+            first = _portfolio_snapshot()
+        with app.test_request_context("/"):
+            assert _portfolio_snapshot() is not first
+
+    def test_scores_count_open_flags_per_dimension(self, client):
+        uc = UseCaseContext(name="Counts")
+        uc.flag_risk(RiskDimension.BIAS, RiskLevel.LOW, "one")
+        uc.flag_risk(RiskDimension.BIAS, RiskLevel.LOW, "two")
+        uc.flag_risk(RiskDimension.BIAS, RiskLevel.LOW, "three").resolve("done")
+        _dashboard.register(uc)
+        r = client.get("/scores")
+        html = r.get_data(as_text=True)
+        row = html[html.index(f"<td>{RiskDimension.BIAS.value}</td>"):]
+        row = row[:row.index("</tr>")]
+        assert row.endswith("<td>2</td>")
+
+    def test_heatmap_headers_cover_custom_dimensions(self, client):
+        from ai_use_case_context.core import Dimension
+        uc = UseCaseContext(name="Custom Heatmap")
+        uc.flag_risk(Dimension("WATERMARK", "Watermarking (forensic)"), RiskLevel.LOW, "x")
+        _dashboard.register(uc)
+        r = client.get("/")
+        assert b'<div class="header">Watermarking</div>' in r.data
+        assert b'<div class="header">Legal</div>' in r.data
+
+    def test_detail_reflects_edited_description(self, client):
+        uc = UseCaseContext(name="Editable", description="<first>")
+        _dashboard.register(uc)
+        assert b"&lt;first&gt;" in client.get("/use-case/Editable").data
+        uc.description = "second & last"
+        r = client.get("/use-case/Editable")
+        assert b"second &amp; last" in r.data
+        assert b"&lt;first&gt;" not in r.data
+
+    def test_add_flag_form_options(self, client):
+        _dashboard.register(UseCaseContext(name="Options"))
+        r = client.get("/use-case/Options")
+        assert b'<option value="LEGAL_IP">' in r.data
+        assert b'<option value="CRITICAL">CRITICAL</option>' in r.data
+        assert b'<option value="NONE">' not in r.data
+
     def test_risk_heatmap_renders(self, client):
         client.post("/seed")
         r = client.get("/")
@@ -194,6 +334,16 @@ class TestFlagActions:
         r = client.post("/use-case/ActionUC/flag/99/resolve", follow_redirects=True)
         assert r.status_code == 200  # Should not crash
 
+    def test_add_flag_rejects_unknown_level(self, client):
+        uc = self._setup_uc()
+        r = client.post("/use-case/ActionUC/add-flag", data={
+            "dimension": "SECURITY",
+            "level": "SEVERE",
+            "description": "bad level",
+        })
+        assert r.status_code == 400
+        assert len(uc.risk_flags) == 1
+
 
 # -- Escalation ------------------------------------------------------------
 
@@ -255,6 +405,40 @@ class TestHooks:
         client.post("/use-case/HookUC2/flag/0/accept")
         assert events == ["HookUC2"]
 
+    def test_governance_events_from_web_actions(self, client):
+        from ai_use_case_context.governance_hooks import (
+            GovernanceHook, clear_hooks, register_hook,
+        )
+
+        received = []
+
+        class Collector(GovernanceHook):
+            def on_event(self, event):
+                received.append(event.to_dict())
+
+        clear_hooks()
+        register_hook(Collector())
+        try:
+            uc = UseCaseContext(name="HookEvents")
+            uc.flag_risk(RiskDimension.BIAS, RiskLevel.HIGH, "skew")
+            _dashboard.register(uc)
+            client.post("/use-case/HookEvents/flag/0/review")
+            client.post("/use-case/HookEvents/flag/0/resolve")
+            client.post(
+                "/use-case/HookEvents/add-flag",
+                data={"dimension": "SAFETY", "level": "LOW", "description": "new"},
+            )
+        finally:
+            clear_hooks()
+        events = received
+        assert [e["event_type"] for e in events] == [
+            "review_started", "flag_resolved", "flag_raised",
+        ]
+        assert all(e["actor"] == "web_dashboard" for e in events)
+        assert all(e["metadata"] == {} for e in events)
+        assert events[0]["dimension"] == "BIAS"
+        assert events[2]["description"] == "new"
+
     def test_off_removes_specific_callback(self, client):
         events = []
 
@@ -348,6 +532,101 @@ class TestHooks:
         assert events_a == ["MultiHookUC"]
         assert events_b == ["MultiHookUC"]
 
+    def test_one_shot_hook_can_unregister_itself(self, client):
+        events = []
+
+        def once(uc_name, idx, flag):
+            events.append("once")
+            off("flag_resolved", once)
+
+        @on("flag_resolved")
+        def after(uc_name, idx, flag):
+            events.append("after")
+
+        on("flag_resolved", once)
+        uc = UseCaseContext(name="OneShotUC")
+        uc.flag_risk(RiskDimension.LEGAL_IP, RiskLevel.HIGH, "a")
+        uc.flag_risk(RiskDimension.BIAS, RiskLevel.HIGH, "b")
+        _dashboard.register(uc)
+        client.post("/use-case/OneShotUC/flag/0/resolve")
+        client.post("/use-case/OneShotUC/flag/1/resolve")
+        assert events == ["after", "once", "after"]
+
+
+# -- Conditional GETs -----------------------------------------------------
+
+
+class TestConditionalGet:
+    @pytest.mark.parametrize("path", ["/", "/scores", "/reviewers"])
+    def test_unchanged_state_returns_304(self, client, path):
+        client.post("/seed")
+        r = client.get(path)
+        etag = r.headers["ETag"]
+        assert etag.startswith("W/")
+        r2 = client.get(path, headers={"If-None-Match": etag})
+        assert r2.status_code == 304
+        assert r2.data == b""
+        assert "Accept-Encoding" in r2.headers["Vary"]
+
+    def test_web_action_changes_etag(self, client):
+        uc = UseCaseContext(name="EtagUC")
+        uc.flag_risk(RiskDimension.BIAS, RiskLevel.HIGH, "x")
+        _dashboard.register(uc)
+        etag = client.get("/").headers["ETag"]
+        client.post("/use-case/EtagUC/flag/0/resolve")
+        r = client.get("/", headers={"If-None-Match": etag})
+        assert r.status_code == 200
+        assert r.headers["ETag"] != etag
+
+    def test_python_change_changes_etag(self, client):
+        uc = UseCaseContext(name="EtagPy")
+        _dashboard.register(uc)
+        etag = client.get("/reviewers").headers["ETag"]
+        uc.flag_risk(RiskDimension.SAFETY, RiskLevel.MEDIUM, "from python")
+        r = client.get("/reviewers", headers={"If-None-Match": etag})
+        assert r.status_code == 200
+        assert b"from python" in r.data
+
+    def test_flag_text_edit_changes_etag(self, client):
+        uc = UseCaseContext(name="EtagText")
+        flag = uc.flag_risk(RiskDimension.SAFETY, RiskLevel.MEDIUM, "before")
+        _dashboard.register(uc)
+        etag = client.get("/reviewers").headers["ETag"]
+        flag.description = "after"
+        r = client.get("/reviewers", headers={"If-None-Match": etag})
+        assert r.status_code == 200
+        assert b"after" in r.data
+        etag = r.headers["ETag"]
+        flag.resolution_notes = "noted"
+        r = client.get("/reviewers", headers={"If-None-Match": etag})
+        assert r.status_code == 200
+
+
+# -- Compression -----------------------------------------------------------
+
+
+class TestCompression:
+    def test_streamed_page_gzipped_when_accepted(self, client):
+        import gzip
+        client.post("/seed")
+        r = client.get("/", headers={"Accept-Encoding": "gzip"})
+        assert r.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in r.headers["Vary"]
+        html = gzip.decompress(r.data)
+        assert b"Portfolio Dashboard" in html
+        assert html.endswith(b"</body></html>")
+
+    def test_buffered_page_gzipped_when_accepted(self, client):
+        import gzip
+        r = client.get("/security", headers={"Accept-Encoding": "gzip"})
+        assert r.headers["Content-Encoding"] == "gzip"
+        assert b"Security Profiles" in gzip.decompress(r.data)
+
+    def test_plain_without_accept_encoding(self, client):
+        r = client.get("/")
+        assert "Content-Encoding" not in r.headers
+        assert b"Portfolio Dashboard" in r.data
+
 
 # -- get/set dashboard sync ------------------------------------------------
 